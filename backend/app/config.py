@@ -6,6 +6,8 @@ class Settings(BaseSettings):
     # MongoDB settings
     MONGODB_URL: str = "mongodb://localhost:27017"
     MONGODB_DB_NAME: str = "pinterest_scraper"
+    # Connections kept by the single shared client (streaming validation and downloads query concurrently)
+    MONGODB_MAX_POOL_SIZE: int = 50
     
     # API settings
     API_PREFIX: str = "/api/v1"
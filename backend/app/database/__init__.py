@@ -4,5 +4,15 @@ from .sessions import SessionDB
 from .pins import PinDB
 from .agents import AgentDB
 from .status import StatusDB
+from .dashboard import DashboardDB
+from .validation_cache import ValidationCacheDB
 
-__all__ = ['BaseDB', 'PromptDB', 'SessionDB', 'PinDB', 'AgentDB', 'StatusDB']
+
+
+def ensure_indexes():
+    """Create the declared indexes for every collection"""
+    for db_class in (PromptDB, SessionDB, PinDB, AgentDB, StatusDB, DashboardDB, ValidationCacheDB):
+        db_class.ensure_indexes()
+
+
+__all__ = ['BaseDB', 'PromptDB', 'SessionDB', 'PinDB', 'AgentDB', 'StatusDB', 'DashboardDB', 'ValidationCacheDB', 'ensure_indexes']
@@ -1,31 +1,63 @@
-from pymongo import MongoClient
+from pymongo import MongoClient, IndexModel
 from app.config import settings
 from functools import lru_cache
 from datetime import datetime
-from typing import List, Dict, Optional, Any
+from typing import List, Dict, Optional, Any, Union
 from bson import ObjectId
 
+
+def to_object_id(value: Union[str, ObjectId]) -> ObjectId:
+    """
+    Return value as an ObjectId, parsing only when given a string
+    
+    Args:
+        value (Union[str, ObjectId]): Hex id string or an already parsed ObjectId
+        
+    Returns:
+        ObjectId: Parsed id (the same object if one was passed in)
+    """
+    return value if isinstance(value, ObjectId) else ObjectId(value)
+
 @lru_cache()
 def get_mongodb_client():
-    return MongoClient(settings.MONGODB_URL)
+    # One client (and connection pool) per process, shared by every *DB class
+    return MongoClient(settings.MONGODB_URL, maxPoolSize=settings.MONGODB_MAX_POOL_SIZE)
 
+@lru_cache()
 def get_database():
     client = get_mongodb_client()
     return client[settings.MONGODB_DB_NAME]
 
+@lru_cache()
+def get_collection_by_name(collection_name: str):
+    return get_database()[collection_name]
+
 
 class BaseDB:
     """Base database operations class with common CRUD methods"""
     
     collection_name: str = None
+    indexes: List[IndexModel] = []
     
     @classmethod
     def get_collection(cls):
-        """Get the MongoDB collection for this class"""
+        """Get the MongoDB collection for this class (handle is resolved once and cached)"""
         if not cls.collection_name:
             raise NotImplementedError("collection_name must be defined")
-        db = get_database()
-        return db[cls.collection_name]
+        return get_collection_by_name(cls.collection_name)
+    
+    @classmethod
+    def ensure_indexes(cls) -> List[str]:
+        """
+        Create the indexes declared in `indexes` (existing ones are left untouched)
+        
+        Returns:
+            List[str]: Names of the declared indexes
+        """
+        if not cls.indexes:
+            return []
+        collection = cls.get_collection()
+        return collection.create_indexes(cls.indexes)
     
     @classmethod
     def create_one(cls, document: Dict) -> ObjectId:
@@ -87,7 +119,8 @@ class BaseDB:
         return cls.get_one({"_id": doc_id})
     
     @classmethod
-    def get_many(cls, filter_dict: Dict = None, sort_by: str = None, sort_order: int = 1, limit: int = None) -> List[Dict]:
+    def get_many(cls, filter_dict: Dict = None, sort_by: str = None, sort_order: int = 1, limit: int = None,
+                 projection: Dict = None) -> List[Dict]:
         """
         Get multiple documents
         
@@ -96,12 +129,13 @@ class BaseDB:
             sort_by (str): Field to sort by
             sort_order (int): 1 for ascending, -1 for descending
             limit (int): Maximum number of documents to return
+            projection (Dict): Fields to return (default: all fields)
             
         Returns:
             List[Dict]: List of documents
         """
         collection = cls.get_collection()
-        cursor = collection.find(filter_dict or {})
+        cursor = collection.find(filter_dict or {}, projection)
         
         if sort_by:
             cursor = cursor.sort(sort_by, sort_order)
@@ -182,3 +216,14 @@ class BaseDB:
         """
         collection = cls.get_collection()
         return collection.count_documents(filter_dict or {})
+    
+    @classmethod
+    def estimated_count(cls) -> int:
+        """
+        Estimate the total number of documents from collection metadata
+        
+        Returns:
+            int: Approximate number of documents (no collection scan)
+        """
+        collection = cls.get_collection()
+        return collection.estimated_document_count()
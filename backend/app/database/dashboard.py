@@ -0,0 +1,89 @@
+from datetime import datetime, timedelta
+from typing import Dict, Optional
+from pymongo import IndexModel
+from .base import BaseDB
+from .pins import PinDB
+from .prompts import PromptDB
+from .sessions import SessionDB
+
+
+class DashboardDB(BaseDB):
+    """Materialized per-status document counts for the dashboard/status views"""
+    
+    collection_name = "dashboard_counts"
+    indexes = [IndexModel([("collection", 1)])]
+    
+    # Collections whose status breakdown is rolled up
+    source_classes = (PinDB, SessionDB, PromptDB)
+    
+    @classmethod
+    def refresh(cls) -> datetime:
+        """
+        Recompute the rollup with one $group/$merge aggregation per source collection
+        
+        Returns:
+            datetime: Timestamp stored on the refreshed rollup documents
+        """
+        refreshed_at = datetime.utcnow()
+        
+        for source_class in cls.source_classes:
+            source_class.get_collection().aggregate([
+                {"$group": {"_id": "$status", "count": {"$sum": 1}}},
+                {"$project": {
+                    "_id": {
+                        "collection": {"$literal": source_class.collection_name},
+                        "status": {"$ifNull": ["$_id", "unknown"]}
+                    },
+                    "collection": {"$literal": source_class.collection_name},
+                    "status": {"$ifNull": ["$_id", "unknown"]},
+                    "count": 1,
+                    "updated_at": {"$literal": refreshed_at}
+                }},
+                {"$merge": {"into": cls.collection_name, "whenMatched": "replace", "whenNotMatched": "insert"}}
+            ])
+        
+        # Statuses that no longer exist were not rewritten by this refresh
+        cls.get_collection().delete_many({"updated_at": {"$lt": refreshed_at}})
+        return refreshed_at
+    
+    @classmethod
+    def last_refreshed_at(cls) -> Optional[datetime]:
+        """
+        Get when the rollup was last recomputed
+        
+        Returns:
+            Optional[datetime]: Timestamp of the newest rollup document, or None if there is none
+        """
+        latest = cls.get_collection().find_one({}, {"updated_at": 1}, sort=[("updated_at", -1)])
+        return latest["updated_at"] if latest else None
+    
+    @classmethod
+    def refresh_if_stale(cls, max_age_seconds: int = 60) -> bool:
+        """
+        Refresh the rollup when it is older than max_age_seconds
+        
+        Args:
+            max_age_seconds (int): Maximum accepted age of the rollup
+            
+        Returns:
+            bool: True if the rollup was refreshed
+        """
+        refreshed_at = cls.last_refreshed_at()
+        if refreshed_at and refreshed_at >= datetime.utcnow() - timedelta(seconds=max_age_seconds):
+            return False
+        cls.refresh()
+        return True
+    
+    @classmethod
+    def get_breakdown(cls, collection_name: str) -> Dict[str, int]:
+        """
+        Get the rolled-up status counts for a collection
+        
+        Args:
+            collection_name (str): Source collection name (e.g., "pins")
+            
+        Returns:
+            Dict[str, int]: Mapping of status to document count
+        """
+        rows = cls.get_many({"collection": collection_name}, projection={"status": 1, "count": 1})
+        return {row["status"]: row["count"] for row in rows}
@@ -1,6 +1,7 @@
 from datetime import datetime
 from typing import List, Optional, Dict
 from bson import ObjectId
+from pymongo import IndexModel, UpdateOne
 from pydantic import BaseModel, Field
 from .base import BaseDB
 
@@ -40,6 +41,17 @@ class PinDB(BaseDB):
     """Database operations for pins collection"""
     
     collection_name = "pins"
+    indexes = [
+        IndexModel([("status", 1)]),
+        # Per-prompt reads, status counts and best-first status listings
+        # (prefixes also serve get_pins_by_prompt and status counts)
+        IndexModel([("prompt_id", 1), ("status", 1), ("match_score", -1)])
+    ]
+    # Fields read by exports and workflow summaries (prompt_id is implied by the query)
+    export_fields = {
+        "image_url": 1, "pin_url": 1, "title": 1, "description": 1,
+        "status": 1, "match_score": 1, "ai_explanation": 1, "metadata": 1
+    }
     
     @classmethod
     def create_pins_from_scraped_data(cls, prompt_id: ObjectId, scraped_pins: List[Dict]) -> List[ObjectId]:
@@ -104,6 +116,33 @@ class PinDB(BaseDB):
             }
         )
     
+    @classmethod
+    def bulk_update_ai_validation(cls, verdicts: List[Dict]) -> int:
+        """
+        Apply AI validation results to many pins in one unordered bulk write
+        
+        Args:
+            verdicts (List[Dict]): Dicts with _id, match_score, status and ai_explanation
+            
+        Returns:
+            int: Number of pins matched
+        """
+        if not verdicts:
+            return 0
+        
+        updates = [
+            UpdateOne(
+                {"_id": verdict["_id"]},
+                {"$set": {
+                    "match_score": verdict["match_score"],
+                    "status": verdict["status"],
+                    "ai_explanation": verdict["ai_explanation"]
+                }}
+            )
+            for verdict in verdicts
+        ]
+        return cls.get_collection().bulk_write(updates, ordered=False).matched_count
+    
     @classmethod
     def update_pin_title(cls, pin_id: ObjectId, title: str) -> bool:
         """
@@ -132,18 +171,105 @@ class PinDB(BaseDB):
         return cls.get_many({"prompt_id": prompt_id})
     
     @classmethod
-    def get_pins_by_status(cls, prompt_id: ObjectId, status: str) -> List[Dict]:
+    def get_pins_by_status(cls, prompt_id: ObjectId, status: str, projection: Dict = None,
+                           sort_by: str = None, sort_order: int = -1, limit: int = None) -> List[Dict]:
         """
         Get pins by status for a specific prompt
         
         Args:
             prompt_id (ObjectId): Prompt ID
             status (str): Pin status ("approved" | "disqualified")
+            projection (Dict): Fields to return (default: all fields)
+            sort_by (str): Field to sort by server-side
+            sort_order (int): 1 for ascending, -1 for descending
+            limit (int): Maximum number of pins to return
             
         Returns:
             List[Dict]: List of pin documents
         """
-        return cls.get_many({"prompt_id": prompt_id, "status": status})
+        return cls.get_many(
+            {"prompt_id": prompt_id, "status": status},
+            sort_by=sort_by,
+            sort_order=sort_order,
+            limit=limit,
+            projection=projection
+        )
+    
+    @classmethod
+    def get_pins_by_prompts_status(cls, prompt_ids: List[ObjectId], status: str,
+                                   projection: Dict = None) -> Dict[ObjectId, List[Dict]]:
+        """
+        Get pins with a status for many prompts in one $in query, best match first
+        
+        Args:
+            prompt_ids (List[ObjectId]): Prompt IDs
+            status (str): Pin status ("ready" | "approved" | "disqualified")
+            projection (Dict): Fields to return (prompt_id is always included)
+            
+        Returns:
+            Dict[ObjectId, List[Dict]]: Pins grouped by prompt ID (every requested ID is present)
+        """
+        pins_by_prompt = {prompt_id: [] for prompt_id in prompt_ids}
+        if not pins_by_prompt:
+            return pins_by_prompt
+        
+        if projection is not None:
+            projection = {**projection, "prompt_id": 1}
+        pins = cls.get_many(
+            {"prompt_id": {"$in": list(pins_by_prompt)}, "status": status},
+            sort_by="match_score",
+            sort_order=-1,
+            projection=projection
+        )
+        for pin in pins:
+            pins_by_prompt[pin["prompt_id"]].append(pin)
+        return pins_by_prompt
+    
+    @classmethod
+    def get_pins_for_export(cls, prompt_id: ObjectId) -> List[Dict]:
+        """
+        Get a prompt's pins with only the exported fields, best match first
+        
+        Args:
+            prompt_id (ObjectId): Prompt ID
+            
+        Returns:
+            List[Dict]: Pin documents limited to export_fields, sorted by match_score desc
+        """
+        return cls.get_many(
+            {"prompt_id": prompt_id},
+            sort_by="match_score",
+            sort_order=-1,
+            projection=cls.export_fields
+        )
+    
+    @classmethod
+    def find_display(cls, prompt_id: ObjectId, status: str = "approved", limit: int = 2, trunc: int = 70) -> List[Dict]:
+        """
+        Get the best-scoring pins with text fields already truncated by the server
+        (the sort and limit are served by the prompt_id/status/match_score index)
+        
+        Args:
+            prompt_id (ObjectId): Prompt ID
+            status (str): Pin status to list
+            limit (int): Maximum number of pins to return
+            trunc (int): Maximum characters kept from ai_explanation and description
+            
+        Returns:
+            List[Dict]: Pins with title, match_score and truncated ai_explanation/description
+        """
+        pipeline = [
+            {"$match": {"prompt_id": prompt_id, "status": status}},
+            {"$sort": {"match_score": -1}},
+            {"$limit": limit},
+            {"$project": {
+                "title": 1,
+                "match_score": 1,
+                "ai_explanation": {"$substrCP": [{"$ifNull": ["$ai_explanation", ""]}, 0, trunc]},
+                "description": {"$substrCP": [{"$ifNull": ["$description", ""]}, 0, trunc]}
+            }}
+        ]
+        return list(cls.get_collection().aggregate(pipeline))
     
     @classmethod
     def get_pin(cls, pin_id: ObjectId) -> Optional[Dict]:
@@ -1,6 +1,8 @@
-from datetime import datetime
-from typing import List, Optional
+import re
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional
 from bson import ObjectId
+from pymongo import IndexModel
 from pydantic import BaseModel, Field
 from .base import BaseDB
 
@@ -23,6 +25,10 @@ class PromptDB(BaseDB):
     """Database operations for prompts collection"""
     
     collection_name = "prompts"
+    indexes = [
+        IndexModel([("status", 1)]),
+        IndexModel([("created_at", -1)])
+    ]
     
     @classmethod
     def create_prompt(cls, text: str) -> ObjectId:
@@ -54,17 +60,37 @@ class PromptDB(BaseDB):
         return cls.update_by_id(prompt_id, {"$set": {"status": status}})
     
     @classmethod
-    def get_prompt_by_id(cls, prompt_id: ObjectId) -> Optional[dict]:
+    def get_prompt_by_id(cls, prompt_id: ObjectId, projection: dict = None) -> Optional[dict]:
         """
         Get prompt by ID
         
         Args:
             prompt_id (ObjectId): Prompt ID
+            projection (dict): Fields to return (default: all fields)
             
         Returns:
             Optional[dict]: Prompt document or None
         """
-        return cls.get_by_id(prompt_id)
+        if projection is None:
+            return cls.get_by_id(prompt_id)
+        return cls.get_collection().find_one({"_id": prompt_id}, projection)
+    
+    @classmethod
+    def get_prompts_by_ids(cls, prompt_ids: List[ObjectId], projection: dict = None) -> Dict[ObjectId, dict]:
+        """
+        Get many prompts in one $in query
+        
+        Args:
+            prompt_ids (List[ObjectId]): Prompt IDs
+            projection (dict): Fields to return (default: all fields)
+            
+        Returns:
+            Dict[ObjectId, dict]: Prompt documents keyed by _id (missing IDs are absent)
+        """
+        if not prompt_ids:
+            return {}
+        prompts = cls.get_many({"_id": {"$in": list(prompt_ids)}}, projection=projection)
+        return {prompt["_id"]: prompt for prompt in prompts}
     
     @classmethod
     def get_all_prompts(cls) -> List[dict]:
@@ -90,12 +116,13 @@ class PromptDB(BaseDB):
         return cls.get_many({"status": status}, sort_by="created_at", sort_order=-1)
     
     @classmethod
-    def get_recent_prompts(cls, limit: int = 20) -> List[dict]:
+    def get_recent_prompts(cls, limit: int = 20, projection: dict = None) -> List[dict]:
         """
         Get recent prompts for history dropdown
         
         Args:
             limit (int): Maximum number of prompts to return
+            projection (dict): Fields to return (default: all fields)
             
         Returns:
             List[dict]: List of recent prompt documents, sorted by most recent first
@@ -104,5 +131,28 @@ class PromptDB(BaseDB):
             filter_dict={},
             sort_by="created_at", 
             sort_order=-1,
-            limit=limit
+            limit=limit,
+            projection=projection
+        )
+    
+    @classmethod
+    def get_recent_prompt_by_text(cls, text: str, status: str = "completed", max_age_seconds: int = 3600) -> Optional[dict]:
+        """
+        Get the newest prompt with the same text (case-insensitive) created within max_age_seconds
+        
+        Args:
+            text (str): Prompt text to look up
+            status (str): Required prompt status
+            max_age_seconds (int): Maximum age of the matching prompt
+            
+        Returns:
+            Optional[dict]: Most recent matching prompt document or None
+        """
+        return cls.get_collection().find_one(
+            {
+                "text": {"$regex": f"^{re.escape(text.strip())}$", "$options": "i"},
+                "status": status,
+                "created_at": {"$gte": datetime.utcnow() - timedelta(seconds=max_age_seconds)}
+            },
+            sort=[("created_at", -1)]
         )
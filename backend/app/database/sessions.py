@@ -1,6 +1,7 @@
 from datetime import datetime
 from typing import List, Optional
 from bson import ObjectId
+from pymongo import IndexModel
 from pydantic import BaseModel, Field
 from .base import BaseDB
 
@@ -25,6 +26,7 @@ class SessionDB(BaseDB):
     """Database operations for sessions collection"""
     
     collection_name = "sessions"
+    indexes = [IndexModel([("status", 1)])]
     
     @classmethod
     def create_session(cls, prompt_id: ObjectId, stage: str) -> ObjectId:
@@ -1,4 +1,4 @@
-from typing import Optional, List, Dict
+from typing import Optional, List, Dict, Union
 from datetime import datetime
 from pydantic import BaseModel, Field
 try:
@@ -6,7 +6,7 @@ try:
 except ImportError:
     # Fallback for environments without pymongo
     ObjectId = str
-from .base import BaseDB
+from .base import BaseDB, to_object_id
 
 
 class StatusSchema(BaseModel):
@@ -29,10 +29,10 @@ class StatusDB(BaseDB):
 
     
     @classmethod
-    def create_workflow_status(cls, prompt_id: str) -> str:
+    def create_workflow_status(cls, prompt_id: Union[str, ObjectId]) -> str:
         """Create a new workflow status document (only if one doesn't exist)"""
         print(f"🔧 Creating workflow status for prompt_id: {prompt_id}")
-        prompt_id_obj = ObjectId(prompt_id)
+        prompt_id_obj = to_object_id(prompt_id)
         
         # Check if status document already exists
         existing = cls.get_one({"prompt_id": prompt_id_obj})
@@ -63,7 +63,7 @@ class StatusDB(BaseDB):
             print(f"✅ Status document created successfully: {result}")
             
             # Verify it was created
-            verification = cls.get_one({"_id": ObjectId(result)})
+            verification = cls.get_one({"_id": to_object_id(result)})
             if verification:
                 print(f"✅ Verification successful: status document exists")
             else:
@@ -77,14 +77,17 @@ class StatusDB(BaseDB):
             raise
     
     @classmethod
-    def update_step_status(cls, prompt_id: str, status: str, message: str = None, progress: float = None) -> bool:
+    def update_step_status(cls, prompt_id: Union[str, ObjectId], status: str, message: str = None, progress: float = None) -> bool:
         """Update workflow status"""
+        # Parse the prompt_id once and reuse the same filter for every query below
+        status_filter = {"prompt_id": to_object_id(prompt_id)}
+        
         # Try to get existing status document
-        current_doc = cls.get_one({"prompt_id": ObjectId(prompt_id)})
+        current_doc = cls.get_one(status_filter)
         
         if not current_doc:
             cls.create_workflow_status(prompt_id)
-            current_doc = cls.get_one({"prompt_id": ObjectId(prompt_id)})
+            current_doc = cls.get_one(status_filter)
             
             if not current_doc:
                 return False
@@ -122,23 +125,15 @@ class StatusDB(BaseDB):
                 "$set": {k: v for k, v in update_data.items() if k != "$push"},
                 "$push": update_data["$push"]
             }
-            result = cls.update_one(
-                {"prompt_id": ObjectId(prompt_id)},
-                update_query
-            )
         else:
             update_query = {"$set": update_data}
-            result = cls.update_one(
-                {"prompt_id": ObjectId(prompt_id)},
-                update_query
-            )
         
-        return result  # cls.update_one already returns boolean
+        return cls.update_one(status_filter, update_query)  # cls.update_one already returns boolean
     
     @classmethod
-    def get_workflow_progress(cls, prompt_id: str) -> Dict:
+    def get_workflow_progress(cls, prompt_id: Union[str, ObjectId]) -> Dict:
         """Get workflow progress"""
-        status_doc = cls.get_one({"prompt_id": ObjectId(prompt_id)})
+        status_doc = cls.get_one({"prompt_id": to_object_id(prompt_id)})
         if not status_doc:
             return {}
         
@@ -153,11 +148,11 @@ class StatusDB(BaseDB):
         }
     
     @classmethod
-    def cleanup_duplicate_status_documents(cls, prompt_id: str) -> int:
+    def cleanup_duplicate_status_documents(cls, prompt_id: Union[str, ObjectId]) -> int:
         """Remove duplicate status documents for a prompt, keeping the most complete one"""
         # Find all status documents for this prompt
         collection = cls.get_collection()
-        all_docs = list(collection.find({"prompt_id": ObjectId(prompt_id)}))
+        all_docs = list(collection.find({"prompt_id": to_object_id(prompt_id)}))
         
         if len(all_docs) <= 1:
             return 0  # No duplicates
@@ -0,0 +1,127 @@
+import hashlib
+from datetime import datetime
+from typing import Dict, List, Optional
+from pymongo import IndexModel, UpdateOne
+from .base import BaseDB
+
+
+class ValidationCacheDB(BaseDB):
+    """AI validation verdicts keyed by (prompt, image URL hash) so repeat runs skip the model call"""
+    
+    collection_name = "validation_cache"
+    indexes = [IndexModel([("prompt", 1), ("image_hash", 1)], unique=True)]
+    
+    @staticmethod
+    def cache_key(prompt_text: str, image_url: str) -> Dict:
+        """
+        Build the lookup key for a prompt/image pair
+        
+        Args:
+            prompt_text (str): Prompt the image was evaluated against
+            image_url (str): Pinterest CDN image URL
+            
+        Returns:
+            Dict: {"prompt": normalized prompt, "image_hash": sha256 of the URL}
+        """
+        return {
+            "prompt": prompt_text.strip().lower(),
+            "image_hash": hashlib.sha256(image_url.encode()).hexdigest()
+        }
+    
+    @classmethod
+    def get_verdict(cls, prompt_text: str, image_url: str) -> Optional[Dict]:
+        """
+        Get a cached verdict for a prompt/image pair
+        
+        Args:
+            prompt_text (str): Prompt text
+            image_url (str): Image URL
+            
+        Returns:
+            Optional[Dict]: {"match_score", "status", "ai_explanation"} or None on a miss
+        """
+        return cls.get_collection().find_one(
+            cls.cache_key(prompt_text, image_url),
+            {"_id": 0, "match_score": 1, "status": 1, "ai_explanation": 1}
+        )
+    
+    @classmethod
+    def get_verdicts(cls, prompt_text: str, image_urls: List[str]) -> Dict[str, Dict]:
+        """
+        Get cached verdicts for many images of one prompt in a single $in query
+        
+        Args:
+            prompt_text (str): Prompt text
+            image_urls (List[str]): Image URLs
+            
+        Returns:
+            Dict[str, Dict]: Verdicts keyed by image URL (misses are absent)
+        """
+        if not image_urls:
+            return {}
+        
+        keys = {url: cls.cache_key(prompt_text, url) for url in image_urls}
+        urls_by_hash = {}
+        for url, key in keys.items():
+            urls_by_hash.setdefault(key["image_hash"], []).append(url)
+        
+        cached = cls.get_collection().find(
+            {"prompt": prompt_text.strip().lower(), "image_hash": {"$in": list(urls_by_hash)}},
+            {"_id": 0, "image_hash": 1, "match_score": 1, "status": 1, "ai_explanation": 1}
+        )
+        verdicts = {}
+        for doc in cached:
+            for url in urls_by_hash[doc.pop("image_hash")]:
+                verdicts[url] = doc
+        return verdicts
+    
+    @classmethod
+    def store_verdict(cls, prompt_text: str, image_url: str, match_score: float, status: str, ai_explanation: str) -> None:
+        """
+        Store (or refresh) the verdict for a prompt/image pair
+        
+        Args:
+            prompt_text (str): Prompt text
+            image_url (str): Image URL
+            match_score (float): AI match score (0.0-1.0)
+            status (str): AI status ("approved" | "disqualified")
+            ai_explanation (str): AI explanation
+        """
+        cls.get_collection().update_one(
+            cls.cache_key(prompt_text, image_url),
+            {"$set": {
+                "match_score": match_score,
+                "status": status,
+                "ai_explanation": ai_explanation,
+                "updated_at": datetime.utcnow()
+            }},
+            upsert=True
+        )
+    
+    @classmethod
+    def store_verdicts(cls, prompt_text: str, verdicts: Dict[str, Dict]) -> None:
+        """
+        Store (or refresh) many verdicts for one prompt in one unordered bulk write
+        
+        Args:
+            prompt_text (str): Prompt text
+            verdicts (Dict[str, Dict]): {"match_score", "status", "ai_explanation"} keyed by image URL
+        """
+        if not verdicts:
+            return
+        
+        updated_at = datetime.utcnow()
+        upserts = [
+            UpdateOne(
+                cls.cache_key(prompt_text, image_url),
+                {"$set": {
+                    "match_score": verdict["match_score"],
+                    "status": verdict["status"],
+                    "ai_explanation": verdict["ai_explanation"],
+                    "updated_at": updated_at
+                }},
+                upsert=True
+            )
+            for image_url, verdict in verdicts.items()
+        ]
+        cls.get_collection().bulk_write(upserts, ordered=False)
@@ -1,6 +1,11 @@
+import threading
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
+from app.database import ensure_indexes
+from app.services.workflow.main import start_log_listener, stop_log_listener
+
 app = FastAPI(
     title="AI Pinterest Scraper",
     version="1.0.0",
@@ -16,6 +21,29 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+@app.on_event("startup")
+def start_workflow_logging():
+    start_log_listener()
+
+def build_database_indexes():
+    # create_indexes is a no-op for indexes that already exist
+    try:
+        ensure_indexes()
+    except Exception as e:
+        # Missing indexes only slow queries down; an unreachable Mongo or a conflicting
+        # index build must not stop the API from starting
+        print(f"⚠️ Could not create database indexes: {type(e).__name__}: {e}")
+
+@app.on_event("startup")
+def create_database_indexes():
+    # Runs off the event loop: with Mongo unreachable, pymongo waits for its server
+    # selection timeout (30s), which would otherwise hold up startup
+    threading.Thread(target=build_database_indexes, name="create-indexes", daemon=True).start()
+
+@app.on_event("shutdown")
+def stop_workflow_logging():
+    stop_log_listener()
+
 @app.get("/")
 def root():
     return {"message": "AI Pinterest Scraper API"}
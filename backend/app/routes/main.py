@@ -27,12 +27,14 @@ async def run_complete_workflow_background(prompt_text: str, prompt_id: str):
     2. AI validation
     """
     print(f"🚀 Starting workflow for prompt: '{prompt_text}' (ID: {prompt_id})")
+    # Parsed once and passed through to every database call below
+    prompt_id = ObjectId(prompt_id)
     
     try:
         # Create workflow orchestrator
         print(f"📋 Creating WorkflowOrchestrator...")
         orchestrator = WorkflowOrchestrator(prompt=prompt_text)
-        orchestrator.prompt_id = ObjectId(prompt_id)
+        orchestrator.prompt_id = prompt_id
         print(f"✅ WorkflowOrchestrator created successfully")
         
         # Phase 1: Pinterest workflow
@@ -56,34 +58,34 @@ async def run_complete_workflow_background(prompt_text: str, prompt_id: str):
             
             # Update status to show error
             await orchestrator.setStatus("failed", f"Pinterest workflow failed: {str(pinterest_error)}", 0.0)
-            PromptDB.update_prompt_status(ObjectId(prompt_id), "error")
+            PromptDB.update_prompt_status(prompt_id, "error")
             return
         
         if not pinterest_result.get('success'):
             print(f"❌ Pinterest workflow failed: {pinterest_result.get('error', 'Unknown error')}")
-            PromptDB.update_prompt_status(ObjectId(prompt_id), "error")
+            PromptDB.update_prompt_status(prompt_id, "error")
             return
         
         print(f"✅ Pinterest workflow completed successfully")
         
         # Phase 2: AI validation workflow
         print(f"🤖 Starting AI validation workflow phase...")
-        ai_result = await orchestrator.run_ai_validation_workflow(ObjectId(prompt_id))
+        ai_result = await orchestrator.run_ai_validation_workflow(prompt_id)
         print(f"🤖 AI validation result: {ai_result}")
         
         if ai_result.get('success'):
             print(f"✅ Complete workflow finished successfully")
-            PromptDB.update_prompt_status(ObjectId(prompt_id), "completed")
+            PromptDB.update_prompt_status(prompt_id, "completed")
         else:
             print(f"❌ AI validation failed: {ai_result.get('error', 'Unknown error')}")
-            PromptDB.update_prompt_status(ObjectId(prompt_id), "error")
+            PromptDB.update_prompt_status(prompt_id, "error")
             
     except Exception as e:
         print(f"💥 Workflow exception: {type(e).__name__}: {str(e)}")
         import traceback
         print(f"📋 Full traceback:")
         traceback.print_exc()
-        PromptDB.update_prompt_status(ObjectId(prompt_id), "error")
+        PromptDB.update_prompt_status(prompt_id, "error")
 
 @router.post("/prompts", response_model=PromptResponse)
 async def create_prompt(prompt_request: PromptRequest, background_tasks: BackgroundTasks):
@@ -159,16 +161,19 @@ async def get_prompt_status(prompt_id: str):
         from ..database.sessions import SessionDB
         from ..database.status import StatusDB
         
+        # Parse the path id once; the string form is kept for the response
+        prompt_oid = ObjectId(prompt_id)
+        
         # Get prompt
-        prompt_doc = PromptDB.get_prompt_by_id(ObjectId(prompt_id))
+        prompt_doc = PromptDB.get_prompt_by_id(prompt_oid)
         if not prompt_doc:
             raise HTTPException(status_code=404, detail="Prompt not found")
             
         # Get sessions
-        sessions = SessionDB.get_sessions_by_prompt(ObjectId(prompt_id))
+        sessions = SessionDB.get_sessions_by_prompt(prompt_oid)
         
         # Get status
-        status_data = StatusDB.get_workflow_progress(prompt_id)
+        status_data = StatusDB.get_workflow_progress(prompt_oid)
         
         # Map sessions to frontend expected format
         sessions_formatted = []
@@ -214,13 +219,16 @@ async def get_prompt_pins(prompt_id: str):
         from ..database.prompts import PromptDB
         from ..database.pins import PinDB
         
+        # Parse the path id once and reuse it for both lookups
+        prompt_oid = ObjectId(prompt_id)
+        
         # Get prompt
-        prompt_doc = PromptDB.get_prompt_by_id(ObjectId(prompt_id))
+        prompt_doc = PromptDB.get_prompt_by_id(prompt_oid)
         if not prompt_doc:
             raise HTTPException(status_code=404, detail="Prompt not found")
             
         # Get pins
-        pins = PinDB.get_pins_by_prompt(ObjectId(prompt_id))
+        pins = PinDB.get_pins_by_prompt(prompt_oid)
         
         # Format pins for frontend
         formatted_pins = []
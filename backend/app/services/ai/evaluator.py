@@ -1,4 +1,5 @@
-from typing import List
+from collections import OrderedDict
+from typing import List, Optional
 from bson import ObjectId
 from pydantic import BaseModel, Field
 from pydantic_ai import Agent, ImageUrl
@@ -7,7 +8,13 @@ from pydantic_ai.providers.openai import OpenAIProvider
 from pydantic_ai.settings import ModelSettings
 
 from app.config import settings
-from app.database import PromptDB, PinDB, AgentDB
+from app.database import PromptDB, PinDB, AgentDB, ValidationCacheDB
+
+# Pins scored together in one model request
+VALIDATION_BATCH_SIZE = 5
+
+# Most recent verdicts kept in memory so repeated images skip even the cache lookup
+RECENT_VERDICTS_SIZE = 32
 
 
 class PinValidation(BaseModel):
@@ -16,8 +23,20 @@ class PinValidation(BaseModel):
     explanation: str = Field(description="2-3 sentences explaining the match quality")
 
 
+class IndexedPinValidation(PinValidation):
+    idx: int = Field(description="Number of the image this verdict is for")
+
+
+class PinBatchValidation(BaseModel):
+    scores: List[IndexedPinValidation] = Field(description="One verdict per numbered image")
+
+
 class AIEvaluator:
-    def __init__(self):
+    def __init__(self, use_cache: bool = True):
+        # With use_cache=False every pin is re-evaluated, but fresh verdicts still refresh the cache
+        self.use_cache = use_cache
+        self._recent_verdicts = OrderedDict()
+        
         if not settings.OPENAI_API_KEY:
             raise ValueError("OPENAI_API_KEY is required for AI evaluation")
         
@@ -44,8 +63,16 @@ class AIEvaluator:
             system_prompt=agent_config["system_prompt"],
             model_settings=model_settings
         )
+        
+        # Same configuration, but scores several numbered images in one request
+        self.batch_agent = Agent(
+            model=self.model,
+            result_type=PinBatchValidation,
+            system_prompt=agent_config["system_prompt"],
+            model_settings=model_settings
+        )
     
-    async def evaluate_pin(self, prompt_text: str, image_url: str, title: str = None, description: str = None) -> PinValidation:
+    def _build_evaluation_prompt(self, prompt_text: str, title: str = None, description: str = None) -> str:
         # Build comprehensive evaluation prompt including textual metadata
         textual_context = ""
         if title:
@@ -54,10 +81,13 @@ class AIEvaluator:
             textual_context += f"\nPin Description: {description}"
         
         # Use the user prompt template from database configuration
-        evaluation_prompt = self.user_prompt_template.format(
+        return self.user_prompt_template.format(
             prompt_text=prompt_text,
             textual_context=textual_context
         )
+    
+    async def evaluate_pin(self, prompt_text: str, image_url: str, title: str = None, description: str = None) -> PinValidation:
+        evaluation_prompt = self._build_evaluation_prompt(prompt_text, title, description)
         
         # Send both the image and text for proper multimodal analysis
         messages = [
@@ -68,6 +98,143 @@ class AIEvaluator:
         result = await self.agent.run(messages)
         return result.data
     
+    @staticmethod
+    def _memory_key(prompt_text: str, image_url: str) -> tuple:
+        # Same normalization as the Mongo cache, so "Cats" and "cats" share one entry in both layers
+        key = ValidationCacheDB.cache_key(prompt_text, image_url)
+        return (key["prompt"], key["image_hash"])
+    
+    def _get_cached_verdict(self, prompt_text: str, image_url: str) -> Optional[dict]:
+        key = self._memory_key(prompt_text, image_url)
+        verdict = self._recent_verdicts.get(key)
+        if verdict is None:
+            # The cache is best-effort: a failed lookup is treated as a miss
+            try:
+                verdict = ValidationCacheDB.get_verdict(prompt_text, image_url)
+            except Exception as e:
+                print(f"Validation cache lookup failed: {e}")
+                return None
+            if verdict is None:
+                return None
+        self._remember_verdict(key, verdict)
+        return verdict
+    
+    def _get_cached_verdicts(self, prompt_text: str, pins: List[dict]) -> List[Optional[dict]]:
+        """In-memory hits first, then one Mongo query for everything else; None marks a miss"""
+        keys = [self._memory_key(prompt_text, pin["image_url"]) for pin in pins]
+        verdicts = [self._recent_verdicts.get(key) for key in keys]
+        
+        missing_urls = [pin["image_url"] for pin, verdict in zip(pins, verdicts) if verdict is None]
+        try:
+            stored = ValidationCacheDB.get_verdicts(prompt_text, missing_urls)
+        except Exception as e:
+            # The cache is best-effort: a failed lookup leaves these pins as misses
+            print(f"Validation cache lookup failed: {e}")
+            stored = {}
+        for i, pin in enumerate(pins):
+            if verdicts[i] is None:
+                verdicts[i] = stored.get(pin["image_url"])
+            if verdicts[i] is not None:
+                self._remember_verdict(keys[i], verdicts[i])
+        return verdicts
+    
+    def _remember_verdict(self, key: tuple, verdict: dict) -> None:
+        self._recent_verdicts[key] = verdict
+        self._recent_verdicts.move_to_end(key)
+        if len(self._recent_verdicts) > RECENT_VERDICTS_SIZE:
+            self._recent_verdicts.popitem(last=False)
+    
+    async def validate_pin(self, prompt_text: str, pin: dict) -> Optional[str]:
+        """Evaluate one pin and store the verdict; returns its status, or None if evaluation failed"""
+        try:
+            image_url = pin["image_url"]
+            verdict = self._get_cached_verdict(prompt_text, image_url) if self.use_cache else None
+            
+            if verdict is None:
+                validation = await self.evaluate_pin(
+                    prompt_text=prompt_text,
+                    image_url=image_url,
+                    title=pin.get("title"),
+                    description=pin.get("description")
+                )
+                verdict = {
+                    "match_score": validation.match_score,
+                    "status": validation.status,
+                    "ai_explanation": validation.explanation
+                }
+                try:
+                    ValidationCacheDB.store_verdict(prompt_text, image_url, **verdict)
+                except Exception as e:
+                    # The verdict is still applied to the pin below
+                    print(f"Error caching AI verdict: {e}")
+                self._remember_verdict(self._memory_key(prompt_text, image_url), verdict)
+            
+            success = PinDB.update_pin_ai_validation(pin_id=pin["_id"], **verdict)
+            return verdict["status"] if success else None
+            
+        except Exception as e:
+            print(f"Error evaluating pin {pin.get('_id')}: {e}")
+            return None
+    
+    async def evaluate_pin_batch(self, prompt_text: str, pins: List[dict]) -> List[Optional[PinValidation]]:
+        """Score several pins in one request; entries the model skipped come back as None"""
+        messages = [f"Evaluate each of the following {len(pins)} numbered images separately "
+                    f"and return one verdict per image with its number as idx."]
+        for idx, pin in enumerate(pins):
+            messages.append(f"Image {idx}:\n" + self._build_evaluation_prompt(prompt_text, pin.get("title"), pin.get("description")))
+            messages.append(ImageUrl(url=pin["image_url"]))
+        
+        result = await self.batch_agent.run(messages)
+        by_idx = {score.idx: score for score in result.data.scores}
+        return [by_idx.get(idx) for idx in range(len(pins))]
+    
+    async def validate_pins(self, prompt_text: str, pins: List[dict]) -> List[Optional[str]]:
+        """Validate pins with one model request for all cache misses; returns each pin's status or None"""
+        verdicts = self._get_cached_verdicts(prompt_text, pins) if self.use_cache else [None] * len(pins)
+        misses = [i for i, verdict in enumerate(verdicts) if verdict is None]
+        
+        if len(misses) > 1:
+            try:
+                validations = await self.evaluate_pin_batch(prompt_text, [pins[i] for i in misses])
+            except Exception as e:
+                print(f"Batch evaluation failed, scoring pins one by one: {e}")
+                validations = [None] * len(misses)
+            
+            fresh_verdicts = {}
+            for i, validation in zip(misses, validations):
+                if validation is None:
+                    continue
+                verdicts[i] = {
+                    "match_score": validation.match_score,
+                    "status": validation.status,
+                    "ai_explanation": validation.explanation
+                }
+                fresh_verdicts[pins[i]["image_url"]] = verdicts[i]
+                self._remember_verdict(self._memory_key(prompt_text, pins[i]["image_url"]), verdicts[i])
+            try:
+                ValidationCacheDB.store_verdicts(prompt_text, fresh_verdicts)
+            except Exception as e:
+                # The verdicts are still applied to the pins below
+                print(f"Error caching AI verdicts: {e}")
+        
+        statuses = []
+        updates = []
+        for pin, verdict in zip(pins, verdicts):
+            if verdict is None:
+                # Single-pin path for batch leftovers (also consults and fills the cache)
+                statuses.append(await self.validate_pin(prompt_text, pin))
+            else:
+                updates.append({"_id": pin["_id"], **verdict})
+                statuses.append(verdict["status"])
+        
+        # Every resolved verdict in the batch lands on the pins in one round-trip
+        try:
+            PinDB.bulk_update_ai_validation(updates)
+        except Exception as e:
+            print(f"Error storing AI validation results: {e}")
+            return [None if verdict is not None else status for verdict, status in zip(verdicts, statuses)]
+        return statuses
+    
     async def evaluate_pins_for_prompt(self, prompt_id: ObjectId) -> dict:
         prompt_doc = PromptDB.get_prompt_by_id(prompt_id)
         if not prompt_doc:
@@ -89,37 +256,15 @@ class AIEvaluator:
         approved_count = 0
         disqualified_count = 0
         
-        for pin in ready_pins:
-            try:
-                pin_id = pin["_id"]
-                image_url = pin["image_url"]
-                title = pin.get("title")
-                description = pin.get("description")
-                
-                validation = await self.evaluate_pin(
-                    prompt_text=prompt_text, 
-                    image_url=image_url,
-                    title=title,
-                    description=description
-                )
-                
-                success = PinDB.update_pin_ai_validation(
-                    pin_id=pin_id,
-                    match_score=validation.match_score,
-                    status=validation.status,
-                    ai_explanation=validation.explanation
-                )
-                
-                if success:
+        for start in range(0, len(ready_pins), VALIDATION_BATCH_SIZE):
+            batch = ready_pins[start:start + VALIDATION_BATCH_SIZE]
+            for status in await self.validate_pins(prompt_text, batch):
+                if status:
                     evaluated_count += 1
-                    if validation.status == "approved":
+                    if status == "approved":
                         approved_count += 1
                     else:
                         disqualified_count += 1
-                
-            except Exception as e:
-                print(f"Error evaluating pin {pin.get('_id')}: {e}")
-                continue
         
         return {
             "success": True,
@@ -1,5 +1,49 @@
 import asyncio
+import re
 from datetime import datetime
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
+
+
+PIN_WRAPPER_SELECTOR = "div[data-test-id='pinWrapper']"
+
+# Title enrichment only reads the DOM, so these downloads are aborted while it runs
+BLOCKED_RESOURCE_TYPES = {"image", "font", "media", "stylesheet"}
+TITLE_SELECTOR = 'div[data-test-id="rich-pin-information"] h1'
+# Pin pages open at once during title enrichment
+ENRICHMENT_CONCURRENCY = 4
+# Retries, with exponential backoff from this base delay, when a pin page answers 429
+RATE_LIMIT_RETRIES = 3
+RATE_LIMIT_BACKOFF_SECONDS = 2
+
+# Pinterest CDN size token (e.g. /236x/); anything smaller than 736 is upgraded
+IMAGE_SIZE_PATTERN = re.compile(r"/(\d+)x/")
+UPGRADED_IMAGE_WIDTH = 736
+# Pinterest prepends this to machine-generated alt text
+ALT_TEXT_PREFIX = "This may contain: "
+# Collects src/alt/href for every pin wrapper that has both an image and a pin link
+FEED_EXTRACT_SCRIPT = """
+() => Array.from(document.querySelectorAll("%s")).flatMap(pin => {
+    const img = pin.querySelector("img");
+    const link = pin.querySelector("a[href*='/pin/']");
+    if (!img || !link) return [];
+    return [{src: img.getAttribute("src"), alt: img.getAttribute("alt"), href: link.getAttribute("href")}];
+})
+""" % PIN_WRAPPER_SELECTOR
+
+
+async def _block_heavy_resources(route):
+    """Abort requests for resources the title lookup never needs"""
+    if route.request.resource_type in BLOCKED_RESOURCE_TYPES:
+        await route.abort()
+    else:
+        await route.continue_()
+
+
+def _upgrade_image_size(match):
+    """Swap a small CDN size token for the 736x rendition, leaving larger ones alone"""
+    if int(match.group(1)) < UPGRADED_IMAGE_WIDTH:
+        return f"/{UPGRADED_IMAGE_WIDTH}x/"
+    return match.group(0)
 
 
 class PinterestPins:
@@ -20,8 +64,8 @@ class PinterestPins:
         """
         print(f"Collecting images: 0/{num_images}")
         
-        # Get all pin wrappers from the feed
-        pins = await self.page.query_selector_all("div[data-test-id='pinWrapper']")
+        # Read every pin wrapper's image and link attributes in one browser round-trip
+        pins = await self.page.evaluate(FEED_EXTRACT_SCRIPT)
         print(f"Found {len(pins)} pins in feed")
         
         if not pins:
@@ -33,26 +77,15 @@ class PinterestPins:
         for i, pin in enumerate(pins):
             try:
                 # Extract image URL (Pinterest CDN URL for AI validation)
-                image_element = await pin.query_selector("img")
-                if not image_element:
-                    continue
-                
-                image_url = await image_element.get_attribute("src")
+                image_url = pin['src']
                 if not image_url or not image_url.startswith("http"):
                     continue
                 
                 # Upgrade to higher resolution if possible
-                if "236x" in image_url:
-                    image_url = image_url.replace("236x", "736x")
-                elif "474x" in image_url:
-                    image_url = image_url.replace("474x", "736x")
+                image_url = IMAGE_SIZE_PATTERN.sub(_upgrade_image_size, image_url, count=1)
                 
                 # Extract pin URL (Pinterest page URL)
-                pin_link = await pin.query_selector("a[href*='/pin/']")
-                if not pin_link:
-                    continue
-                
-                pin_url = await pin_link.get_attribute("href")
+                pin_url = pin['href']
                 if not pin_url:
                     continue
                 
@@ -61,12 +94,10 @@ class PinterestPins:
                     pin_url = f"https://pinterest.com{pin_url}"
                 
                 # Extract description from image alt text (cleaned)
-                description = await image_element.get_attribute("alt")
+                description = pin['alt']
                 if description:
-                    # Clean Pinterest prefixes
-                    if description.startswith("This may contain: "):
-                        description = description.replace("This may contain: ", "")
-                    description = description.strip()
+                    # An alt text that is only the prefix leaves nothing to keep
+                    description = description.removeprefix(ALT_TEXT_PREFIX).strip() or None
                 else:
                     description = None
                 
@@ -97,53 +128,86 @@ class PinterestPins:
         print(f"\nTotal images found in feed: {len(pin_data_list)}")
         return pin_data_list
     
-    async def enrich_with_titles(self, pin_data_list):
+    async def _open_pin_page(self, page, pin_url):
+        """Navigate to a pin page, backing off exponentially while Pinterest answers 429"""
+        for attempt in range(RATE_LIMIT_RETRIES + 1):
+            # Only wait for the response, not for every subresource
+            response = await page.goto(pin_url, wait_until="commit", timeout=15000)
+            if response is None or response.status != 429 or attempt == RATE_LIMIT_RETRIES:
+                return response
+            delay = RATE_LIMIT_BACKOFF_SECONDS * 2 ** attempt
+            print(f"  Rate limited, retrying in {delay}s...")
+            await asyncio.sleep(delay)
+    
+    async def _enrich_pin(self, page, index, total, pin_data):
+        """Fetch one pin's title on the given page; returns the pin data with title set"""
+        try:
+            print(f"Fetching title {index+1}/{total}...")
+            await self._open_pin_page(page, pin_data['pin_url'])
+            
+            # Extract title from rich-pin-information as soon as it renders
+            title = None
+            try:
+                title_element = await page.wait_for_selector(TITLE_SELECTOR, timeout=5000)
+                title = await title_element.text_content()
+                title = title.strip() if title else None
+                print(f"  Found: {title}")
+            except PlaywrightTimeoutError:
+                print("  No title found")
+            except Exception:
+                print("  Title extraction failed")
+            
+            # Update pin data with title
+            enriched_pin = pin_data.copy()
+            enriched_pin['title'] = title
+            return enriched_pin
+            
+        except Exception as e:
+            print(f"  Error fetching title for pin {index+1}: {e}")
+            # Keep original data without title
+            return pin_data
+    
+    async def enrich_with_titles(self, pin_data_list, on_pin_enriched=None):
         """
-        Navigate to each pin URL to extract h1 titles
+        Navigate to each pin URL to extract h1 titles, ENRICHMENT_CONCURRENCY pages at a time
         
         Args:
             pin_data_list (list): List of pin dictionaries from scrape_feed()
+            on_pin_enriched (callable): Optional async callback(index, pin_data) run as each pin finishes
             
         Returns:
-            list: Pin data enriched with titles
+            list: Pin data enriched with titles (same order as pin_data_list)
         """
         if not pin_data_list:
             return pin_data_list
             
         print(f"\nEnriching {len(pin_data_list)} pins with titles...")
-        enriched_data = []
+        total = len(pin_data_list)
+        enriched_data = list(pin_data_list)
+        # Shared by all workers, so each pin is taken exactly once
+        pending = iter(enumerate(pin_data_list))
+        context = self.page.context
         
-        for i, pin_data in enumerate(pin_data_list):
+        async def enrich_worker():
+            page = await context.new_page()
             try:
-                print(f"Fetching title {i+1}/{len(pin_data_list)}...")
-                
-                # Navigate to pin page
-                await self.page.goto(pin_data['pin_url'], timeout=15000)
-                await asyncio.sleep(2)
-                
-                # Extract title from rich-pin-information
-                title = None
-                try:
-                    title_element = await self.page.query_selector('div[data-test-id="rich-pin-information"] h1')
-                    if title_element:
-                        title = await title_element.text_content()
-                        title = title.strip() if title else None
-                        print(f"  Found: {title}")
-                    else:
-                        print("  No title found")
-                except Exception:
-                    print("  Title extraction failed")
-                
-                # Update pin data with title
-                enriched_pin = pin_data.copy()
-                enriched_pin['title'] = title
-                enriched_data.append(enriched_pin)
-                
-            except Exception as e:
-                print(f"  Error fetching title for pin {i+1}: {e}")
-                # Keep original data without title
-                enriched_data.append(pin_data)
-                continue
+                for i, pin_data in pending:
+                    enriched_data[i] = await self._enrich_pin(page, i, total, pin_data)
+                    if on_pin_enriched:
+                        await on_pin_enriched(i, enriched_data[i])
+            finally:
+                await page.close()
+        
+        # Route on the context so every worker page skips heavy resources
+        await context.route("**/*", _block_heavy_resources)
+        try:
+            # A failing worker (e.g. its on_pin_enriched callback) cancels its siblings,
+            # so no page is still navigating once the route is removed
+            async with asyncio.TaskGroup() as task_group:
+                for _ in range(min(ENRICHMENT_CONCURRENCY, total)):
+                    task_group.create_task(enrich_worker())
+        finally:
+            await context.unroute("**/*", _block_heavy_resources)
         
         print(f"Title enrichment completed!")
         return enriched_data
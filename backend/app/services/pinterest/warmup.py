@@ -1,5 +1,12 @@
 import asyncio
+import random
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
 from .session import PinterestSession
+from .pins import PIN_WRAPPER_SELECTOR
+
+# Bounds (ms) for the adaptive wait after scrolling an empty feed
+SCROLL_WAIT_MIN_MS = 500
+SCROLL_WAIT_MAX_MS = 4000
 
 class PinterestWarmup(PinterestSession):
     def __init__(self, prompt: str, username: str = None, password: str = None, log_callback=None, progress_callback=None):
@@ -31,9 +38,10 @@ class PinterestWarmup(PinterestSession):
             await asyncio.sleep(3)
             
             # Wait for pins to load
-            await self.page.wait_for_selector('div[data-test-id="pinWrapper"]', timeout=10000)
+            await self.page.wait_for_selector(PIN_WRAPPER_SELECTOR, timeout=10000)
             
             clicks_made = 0
+            scroll_wait_ms = SCROLL_WAIT_MIN_MS
             
             # Fixed 5 pin interactions
             for i in range(warmup_clicks):
@@ -48,13 +56,21 @@ class PinterestWarmup(PinterestSession):
                         self.log_callback("⚠️ No progress callback available")
                     
                     # Get pins
-                    pins = await self.page.query_selector_all('div[data-test-id="pinWrapper"]')
+                    pins = await self.page.query_selector_all(PIN_WRAPPER_SELECTOR)
                     
                     if not pins:
                         self.log_callback("No pins found, scrolling...")
                         await self.page.evaluate("window.scrollBy(0, 800)")
-                        await asyncio.sleep(2)
+                        try:
+                            # Continue as soon as pins mount; the wait only grows while the feed stays empty
+                            await self.page.wait_for_selector(PIN_WRAPPER_SELECTOR, timeout=scroll_wait_ms)
+                            scroll_wait_ms = SCROLL_WAIT_MIN_MS
+                        except PlaywrightTimeoutError:
+                            scroll_wait_ms = min(scroll_wait_ms * 2, SCROLL_WAIT_MAX_MS)
+                        # Small jitter so scrolls aren't perfectly periodic
+                        await asyncio.sleep(random.uniform(0, 0.2))
                         continue
+                    scroll_wait_ms = SCROLL_WAIT_MIN_MS
                     
                     # Pick a pin to interact with
                     pin_index = i % len(pins)
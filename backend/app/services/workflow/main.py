@@ -1,11 +1,60 @@
 import asyncio
+import atexit
+import logging
+import queue
+import sys
+from logging.handlers import QueueHandler, QueueListener
 from typing import List, Dict, Optional
 from datetime import datetime
 from bson import ObjectId
 
-from ..pinterest.warmup import PinterestWarmup
-from ..pinterest.pins import PinterestPins
-from ..ai.evaluator import AIEvaluator
+
+# Workflow log records are queued on the event loop thread and written to stdout
+# by a background listener thread, so bursts of log lines never block the loop.
+logger = logging.getLogger("workflow")
+logger.setLevel(logging.INFO)
+logger.propagate = False
+
+
+class _ListenerQueueHandler(QueueHandler):
+    """Queue handler that starts the listener on first use, so records are never stranded"""
+    
+    def emit(self, record: logging.LogRecord) -> None:
+        start_log_listener()
+        super().emit(record)
+
+
+_log_queue = queue.SimpleQueue()
+logger.addHandler(_ListenerQueueHandler(_log_queue))
+
+# stdout, like the print() calls this replaced, so log lines interleave with script output
+_log_stream_handler = logging.StreamHandler(sys.stdout)
+_log_stream_handler.setFormatter(logging.Formatter("[%(asctime)s] %(message)s"))
+_log_listener = QueueListener(_log_queue, _log_stream_handler)
+_log_listener_started = False
+
+# Pins validated at the same time while the streaming workflow is still scraping
+AI_VALIDATION_CONCURRENCY = 4
+
+
+def start_log_listener() -> None:
+    """Start the background thread that writes queued workflow log records"""
+    global _log_listener_started
+    if not _log_listener_started:
+        _log_listener.start()
+        _log_listener_started = True
+
+
+def stop_log_listener() -> None:
+    """Flush pending workflow log records and stop the listener thread"""
+    global _log_listener_started
+    if _log_listener_started:
+        _log_listener.stop()
+        _log_listener_started = False
+
+
+# Flush whatever is still queued when the process exits without stop_log_listener()
+atexit.register(stop_log_listener)
 
 
 class WorkflowOrchestrator:
@@ -36,12 +85,11 @@ class WorkflowOrchestrator:
     
     def _log(self, message: str) -> None:
         """Add log message to current session"""
-        timestamp = datetime.now().isoformat()
-        log_entry = f"[{timestamp}] {message}"
-        print(log_entry)
+        logger.info(message)
         
         if self.current_session_id:
             from ...database.sessions import SessionDB
+            log_entry = f"[{datetime.now().isoformat()}] {message}"
             SessionDB.add_session_log(self.current_session_id, log_entry)
     
     async def setStatus(self, status: str, message: str = None, progress_percentage: float = None) -> None:
@@ -57,9 +105,9 @@ class WorkflowOrchestrator:
             # Debug logging
             print(f"🔄 setStatus called: status={status}, progress={progress_percentage}, message={message}")
             
-            # Update status in database
+            # Update status in database (StatusDB parses the ObjectId directly, no str round-trip)
             result = StatusDB.update_step_status(
-                prompt_id=str(self.prompt_id),
+                prompt_id=self.prompt_id,
                 status=status,
                 message=message,
                 progress=progress_percentage
@@ -81,14 +129,14 @@ class WorkflowOrchestrator:
             print(f"🔧 Initializing workflow status for prompt_id: {self.prompt_id}")
             
             self.current_status_id = StatusDB.create_workflow_status(
-                prompt_id=str(self.prompt_id)
+                prompt_id=self.prompt_id
             )
             
             print(f"✅ Status document created with ID: {self.current_status_id}")
             
             # Immediately set initial status
             StatusDB.update_step_status(
-                prompt_id=str(self.prompt_id),
+                prompt_id=self.prompt_id,
                 status="pending",
                 message="Workflow initialized",
                 progress=0.0
@@ -104,7 +152,8 @@ class WorkflowOrchestrator:
             return None
     
     async def run_pinterest_workflow(self, num_images: int = 20, headless: bool = True, 
-                                   username: Optional[str] = None, password: Optional[str] = None) -> Dict:
+                                   username: Optional[str] = None, password: Optional[str] = None,
+                                   pin_queue: Optional[asyncio.Queue] = None, on_pins_saved=None) -> Dict:
         """
         Execute Pinterest-specific workflow: warmup -> scraping -> enrichment
         
@@ -113,6 +162,8 @@ class WorkflowOrchestrator:
             headless (bool): Run browser in headless mode
             username (str): Pinterest username (optional, uses env if not provided)
             password (str): Pinterest password (optional, uses env if not provided)
+            pin_queue (asyncio.Queue): Optional queue receiving each pin as soon as it is enriched
+            on_pins_saved (callable): Optional callback(prompt_id) run once scraped pins are stored
             
         Returns:
             Dict: Complete workflow results with prompt_id and status
@@ -149,8 +200,10 @@ class WorkflowOrchestrator:
             self.current_session_id = pinterest_workflow.current_session_id
             print(f"🔧 Current session ID set: {self.current_session_id}")
             
-            # Pass status tracking to Pinterest workflow
+            # Pass status tracking and streaming hooks to Pinterest workflow
             pinterest_workflow.orchestrator = self
+            pinterest_workflow.pin_queue = pin_queue
+            pinterest_workflow.on_pins_saved = on_pins_saved
             print(f"🔧 Orchestrator linked to Pinterest workflow")
             
             # Send status update before starting workflow
@@ -208,7 +261,7 @@ class WorkflowOrchestrator:
             
             # Find existing status document - don't create a new one
             from ...database.status import StatusDB
-            existing_status = StatusDB.get_workflow_progress(str(prompt_id))
+            existing_status = StatusDB.get_workflow_progress(prompt_id)
             if existing_status:
                 # Reuse existing status tracking
                 self.current_status_id = str(prompt_id)  # Use prompt_id as identifier
@@ -226,6 +279,7 @@ class WorkflowOrchestrator:
             self._log(f"Starting AI validation for prompt: {prompt_doc['text']}")
             
             # Initialize AI evaluator
+            from ..ai.evaluator import AIEvaluator
             evaluator = AIEvaluator()
             await self.setStatus("running", "AI validation system initialized", progress_percentage=75.0)
             
@@ -298,6 +352,95 @@ class WorkflowOrchestrator:
                 "error": str(e)
             }
 
+    async def run_streaming_workflow(self, num_images: int = 20, headless: bool = True,
+                                     username: Optional[str] = None, password: Optional[str] = None,
+                                     on_pins_saved=None, concurrency: int = AI_VALIDATION_CONCURRENCY,
+                                     use_cache: bool = True) -> Dict:
+        """
+        Execute scraping/enrichment and AI validation as one pipeline: each pin is
+        validated as soon as it is enriched instead of after the whole Pinterest phase
+        
+        Args:
+            num_images (int): Number of images to scrape
+            headless (bool): Run browser in headless mode
+            username (str): Pinterest username (optional, uses env if not provided)
+            password (str): Pinterest password (optional, uses env if not provided)
+            on_pins_saved (callable): Optional callback(prompt_id) run once scraped pins are stored
+            concurrency (int): Number of pins validated at the same time
+            use_cache (bool): Reuse cached verdicts for images already scored against this prompt
+            
+        Returns:
+            Dict: Pinterest workflow result plus evaluated/approved/disqualified/unevaluated counts
+                  (a run with unevaluated pins is partial: the prompt is marked error, not completed)
+        """
+        from ...database.prompts import PromptDB
+        from ..ai.evaluator import AIEvaluator, VALIDATION_BATCH_SIZE
+        
+        # Fail before the browser starts if the evaluator cannot be configured
+        try:
+            evaluator = AIEvaluator(use_cache=use_cache)
+        except ValueError as e:
+            return {'success': False, 'error': str(e), 'prompt_id': None}
+        
+        pin_queue = asyncio.Queue()
+        counts = {'evaluated_count': 0, 'approved_count': 0, 'disqualified_count': 0}
+        
+        async def validate_from_queue():
+            # None is the end-of-stream marker, one per validator
+            while (pin := await pin_queue.get()) is not None:
+                # Score whatever else is already waiting in the same request, up to one batch
+                batch = [pin]
+                while len(batch) < VALIDATION_BATCH_SIZE and not pin_queue.empty():
+                    next_pin = pin_queue.get_nowait()
+                    if next_pin is None:
+                        # Hand the end marker back for this validator's next loop
+                        pin_queue.put_nowait(None)
+                        break
+                    batch.append(next_pin)
+                
+                try:
+                    statuses = await evaluator.validate_pins(self.prompt, batch)
+                except Exception as e:
+                    # The batch stays "ready" (unevaluated); this validator keeps consuming
+                    self._log(f"AI validation failed for {len(batch)} pins: {e}")
+                    continue
+                
+                for status in statuses:
+                    if status:
+                        counts['evaluated_count'] += 1
+                        counts[f'{status}_count'] += 1
+        
+        validators = [asyncio.create_task(validate_from_queue()) for _ in range(concurrency)]
+        try:
+            result = await self.run_pinterest_workflow(
+                num_images, headless, username, password,
+                pin_queue=pin_queue, on_pins_saved=on_pins_saved
+            )
+        finally:
+            for _ in validators:
+                pin_queue.put_nowait(None)
+            await asyncio.gather(*validators)
+        
+        result.update(counts)
+        if not result['success']:
+            return result
+        
+        message = f"Validation completed: {counts['approved_count']} approved, {counts['disqualified_count']} disqualified"
+        unevaluated_count = max(result['pin_count'] - counts['evaluated_count'], 0)
+        result['unevaluated_count'] = unevaluated_count
+        if unevaluated_count > 0:
+            # Not "completed", so a partially validated run is never reused as a cached result
+            message += f", {unevaluated_count} left unevaluated"
+            PromptDB.update_prompt_status(self.prompt_id, "error")
+            self._log(message)
+            await self.setStatus("failed", message, progress_percentage=100.0)
+            return result
+        
+        PromptDB.update_prompt_status(self.prompt_id, "completed")
+        self._log(message)
+        await self.setStatus("completed", message, progress_percentage=100.0)
+        return result
+
 
 class PinterestWorkflowHandler:
     """
@@ -323,15 +466,18 @@ class PinterestWorkflowHandler:
         
         # Reference to orchestrator for status tracking
         self.orchestrator = None
+        
+        # Streaming hooks: enriched pins are put on pin_queue, on_pins_saved(prompt_id) fires after scraping
+        self.pin_queue = None
+        self.on_pins_saved = None
     
     def _log(self, message: str) -> None:
         """Add log message to current session"""
-        timestamp = datetime.now().isoformat()
-        log_entry = f"[{timestamp}] {message}"
-        print(log_entry)
+        logger.info(message)
         
         if self.current_session_id:
             from ...database.sessions import SessionDB
+            log_entry = f"[{datetime.now().isoformat()}] {message}"
             SessionDB.add_session_log(self.current_session_id, log_entry)
     
     async def initialize_session(self, headless: bool = True) -> bool:
@@ -347,6 +493,10 @@ class PinterestWorkflowHandler:
         try:
             self._log("Initializing Pinterest session...")
             
+            # Playwright is only loaded once a browser is actually needed
+            from ..pinterest.warmup import PinterestWarmup
+            from ..pinterest.pins import PinterestPins
+            
             # Create progress callback that updates status
             def progress_callback_sync(progress_percentage):
                 if self.orchestrator:
@@ -508,6 +658,8 @@ class PinterestWorkflowHandler:
                 # Save pins to database
                 pin_ids = PinDB.create_pins_from_scraped_data(self.prompt_id, pin_data)
                 self._log(f"Saved {len(pin_ids)} pins to database")
+                if self.on_pins_saved:
+                    self.on_pins_saved(self.prompt_id)
                 
                 # Update status to running with 66% progress (2/3 phases done)
                 if self.orchestrator:
@@ -606,17 +758,22 @@ class PinterestWorkflowHandler:
                 }
                 pin_data_for_enrichment.append((pin["_id"], pin_data))
             
-            # Enrich titles with progress tracking
-            enriched_data = await self.pins_handler.enrich_with_titles([data for _, data in pin_data_for_enrichment])
-            
-            # Update database with enriched titles
-            from ...database.pins import PinDB
+            # Store each title as soon as it is found and hand the pin to the validation stream
             titles_found = 0
-            for i, (pin_id, _) in enumerate(pin_data_for_enrichment):
-                if i < len(enriched_data) and enriched_data[i].get("title"):
-                    # Update the pin in database with the new title
-                    PinDB.update_pin_title(pin_id, enriched_data[i]["title"])
+            
+            async def store_enriched_pin(index, enriched_pin):
+                nonlocal titles_found
+                pin_id = pin_data_for_enrichment[index][0]
+                if enriched_pin.get("title"):
+                    PinDB.update_pin_title(pin_id, enriched_pin["title"])
                     titles_found += 1
+                if self.pin_queue is not None:
+                    await self.pin_queue.put({"_id": pin_id, **enriched_pin})
+            
+            enriched_data = await self.pins_handler.enrich_with_titles(
+                [data for _, data in pin_data_for_enrichment],
+                on_pin_enriched=store_enriched_pin
+            )
             
             self._log(f"Title enrichment completed - {len(enriched_data)} pins processed")
             
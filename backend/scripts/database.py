@@ -6,11 +6,20 @@ Provides functions to clear/reset the database collections
 
 import sys
 import argparse
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 # Add app directory to path for imports
 sys.path.append(str(Path(__file__).parent.parent))
-from app.database import PromptDB, SessionDB, PinDB, AgentDB, StatusDB
+from app.database import PromptDB, SessionDB, PinDB, AgentDB, StatusDB, DashboardDB, ensure_indexes
+
+# Collections emptied by clear_database, in reporting order
+CLEARED_COLLECTIONS = (PinDB, SessionDB, PromptDB, StatusDB)
+
+def run_per_collection(operation):
+    """Run operation(db_class) for every cleared collection concurrently, keeping order"""
+    with ThreadPoolExecutor(max_workers=len(CLEARED_COLLECTIONS)) as executor:
+        return list(executor.map(operation, CLEARED_COLLECTIONS))
 
 def clear_database():
     """Clear all data from pins, sessions, prompts, and status collections"""
@@ -18,11 +27,10 @@ def clear_database():
     print("🗑️  Clearing database collections...")
     print("=" * 50)
     
-    # Get counts before deletion
-    pins_count = len(PinDB.get_many())
-    sessions_count = len(SessionDB.get_many())
-    prompts_count = len(PromptDB.get_many())
-    status_count = len(StatusDB.get_many())
+    # Get counts before deletion (metadata-only, issued concurrently)
+    pins_count, sessions_count, prompts_count, status_count = run_per_collection(
+        lambda db_class: db_class.estimated_count()
+    )
     
     print(f"Before deletion:")
     print(f"  Pins: {pins_count}")
@@ -39,31 +47,19 @@ def clear_database():
     # Delete all documents
     print("\n🗑️  Deleting documents...")
     
-    # Delete pins
-    pins_collection = PinDB.get_collection()
-    pins_result = pins_collection.delete_many({})
+    # Collections are independent, so the deletes run concurrently
+    pins_result, sessions_result, prompts_result, status_result = run_per_collection(
+        lambda db_class: db_class.get_collection().delete_many({})
+    )
     print(f"  Deleted {pins_result.deleted_count} pins")
-    
-    # Delete sessions
-    sessions_collection = SessionDB.get_collection()
-    sessions_result = sessions_collection.delete_many({})
     print(f"  Deleted {sessions_result.deleted_count} sessions")
-    
-    # Delete prompts
-    prompts_collection = PromptDB.get_collection()
-    prompts_result = prompts_collection.delete_many({})
     print(f"  Deleted {prompts_result.deleted_count} prompts")
-    
-    # Delete status
-    status_collection = StatusDB.get_collection()
-    status_result = status_collection.delete_many({})
     print(f"  Deleted {status_result.deleted_count} status documents")
     
-    # Verify deletion
-    remaining_pins = len(PinDB.get_many())
-    remaining_sessions = len(SessionDB.get_many())
-    remaining_prompts = len(PromptDB.get_many())
-    remaining_status = len(StatusDB.get_many())
+    # Verify deletion with exact server-side counts, issued concurrently
+    remaining_pins, remaining_sessions, remaining_prompts, remaining_status = run_per_collection(
+        lambda db_class: db_class.count()
+    )
     
     print(f"\nAfter deletion:")
     print(f"  Pins: {remaining_pins}")
@@ -71,6 +67,9 @@ def clear_database():
     print(f"  Prompts: {remaining_prompts}")
     print(f"  Status: {remaining_status}")
     
+    # Drop the now-stale status rollup
+    DashboardDB.refresh()
+    
     if remaining_pins == 0 and remaining_sessions == 0 and remaining_prompts == 0 and remaining_status == 0:
         print("\n✅ Database cleared successfully!")
     else:
@@ -82,54 +81,49 @@ def show_database_status():
     print("📊 Database Status")
     print("=" * 50)
     
-    # Get all documents
-    pins = PinDB.get_many()
-    sessions = SessionDB.get_many()
-    prompts = PromptDB.get_many()
-    status_docs = StatusDB.get_many()
+    # Get document counts
+    pins_count = PinDB.estimated_count()
+    sessions_count = SessionDB.estimated_count()
+    prompts_count = PromptDB.estimated_count()
+    status_count = StatusDB.estimated_count()
     
     print(f"Total Documents:")
-    print(f"  📌 Pins: {len(pins)}")
-    print(f"  🔄 Sessions: {len(sessions)}")
-    print(f"  💭 Prompts: {len(prompts)}")
-    print(f"  📈 Status: {len(status_docs)}")
+    print(f"  📌 Pins: {pins_count}")
+    print(f"  🔄 Sessions: {sessions_count}")
+    print(f"  💭 Prompts: {prompts_count}")
+    print(f"  📈 Status: {status_count}")
+    
+    # Status breakdowns come from the materialized rollup (recomputed at most once a minute),
+    # so they can lag the live totals above; show how old they are
+    DashboardDB.refresh_if_stale(max_age_seconds=60)
+    refreshed_at = DashboardDB.last_refreshed_at()
+    if refreshed_at:
+        print(f"\nStatus breakdowns as of {refreshed_at:%Y-%m-%d %H:%M:%S} UTC (may lag the totals by up to 60s)")
     
-    if pins:
+    if pins_count:
         # Show pin status breakdown
-        status_counts = {}
-        for pin in pins:
-            status = pin.get('status', 'unknown')
-            status_counts[status] = status_counts.get(status, 0) + 1
-        
         print(f"\nPin Status Breakdown:")
-        for status, count in status_counts.items():
+        for status, count in DashboardDB.get_breakdown(PinDB.collection_name).items():
             print(f"  {status}: {count}")
     
-    if sessions:
+    if sessions_count:
         # Show session status breakdown
-        session_status_counts = {}
-        for session in sessions:
-            status = session.get('status', 'unknown')
-            session_status_counts[status] = session_status_counts.get(status, 0) + 1
-        
         print(f"\nSession Status Breakdown:")
-        for status, count in session_status_counts.items():
+        for status, count in DashboardDB.get_breakdown(SessionDB.collection_name).items():
             print(f"  {status}: {count}")
     
-    if prompts:
+    if prompts_count:
         # Show prompt status breakdown
-        prompt_status_counts = {}
-        for prompt in prompts:
-            status = prompt.get('status', 'unknown')
-            prompt_status_counts[status] = prompt_status_counts.get(status, 0) + 1
-        
         print(f"\nPrompt Status Breakdown:")
-        for status, count in prompt_status_counts.items():
+        for status, count in DashboardDB.get_breakdown(PromptDB.collection_name).items():
             print(f"  {status}: {count}")
         
-        # Show recent prompts
+        # Show recent prompts (sorted and limited server-side)
         print(f"\nRecent Prompts:")
-        recent_prompts = sorted(prompts, key=lambda x: x.get('created_at', ''), reverse=True)[:5]
+        recent_prompts = PromptDB.get_recent_prompts(
+            limit=5,
+            projection={"text": 1, "created_at": 1, "status": 1}
+        )
         for i, prompt in enumerate(recent_prompts, 1):
             created_at = prompt.get('created_at', 'Unknown')
             text = prompt.get('text', 'No text')[:50]
@@ -184,6 +178,15 @@ Analyze both the visual elements (style, mood, aesthetic) and the textual contex
     print("   User prompt template: Configured for multimodal analysis")
     print("\n🎯 Agent setup completed!")
 
+def setup_indexes():
+    """Create the indexes declared on every collection"""
+    print("🗂️  Setting up collection indexes...")
+    print("=" * 50)
+    
+    ensure_indexes()
+    
+    print("✅ Indexes are in place")
+
 def main():
     """Main function with menu options or command line arguments"""
     
@@ -193,6 +196,7 @@ def main():
         epilog="""Examples:
   python3 scripts/database.py --clear     # Clear database immediately
   python3 scripts/database.py --status    # Show database status
+  python3 scripts/database.py --setup-indexes  # Create collection indexes
   python3 scripts/database.py             # Interactive menu"""
     )
     
@@ -211,6 +215,11 @@ def main():
         action="store_true", 
         help="Setup default agent configurations"
     )
+    parser.add_argument(
+        "--setup-indexes", 
+        action="store_true", 
+        help="Create collection indexes"
+    )
     
     args = parser.parse_args()
     
@@ -233,16 +242,23 @@ def main():
         setup_agents()
         return
     
+    if getattr(args, 'setup_indexes', False):
+        print("🗄️  Database Management Tool - Index Setup Mode")
+        print("=" * 50)
+        setup_indexes()
+        return
+    
     # Interactive menu mode
     print("🗄️  Database Management Tool")
     print("=" * 50)
     print("1. Show database status")
     print("2. Clear all database collections")
     print("3. Setup agent configurations")
-    print("4. Exit")
+    print("4. Setup collection indexes")
+    print("5. Exit")
     
     while True:
-        choice = input("\nSelect option (1-4): ").strip()
+        choice = input("\nSelect option (1-5): ").strip()
         
         if choice == '1':
             print()
@@ -254,10 +270,13 @@ def main():
             print()
             setup_agents()
         elif choice == '4':
+            print()
+            setup_indexes()
+        elif choice == '5':
             print("👋 Goodbye!")
             break
         else:
-            print("❌ Invalid choice. Please select 1, 2, 3, or 4.")
+            print("❌ Invalid choice. Please select 1, 2, 3, 4, or 5.")
 
 if __name__ == "__main__":
     main()
@@ -4,20 +4,156 @@ Download images from Pinterest URLs stored in JSON metadata files.
 This is for testing purposes only - the main app uses URLs directly.
 """
 
-import json
 import argparse
+import asyncio
+import os
+import shutil
 import sys
-import urllib.request
+from collections import defaultdict
 from pathlib import Path
-from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlparse
 
-def download_image(img_url, output_path):
-    """Download image from URL to specified path"""
+import aiohttp
+import orjson
+
+# Concurrent downloads share one keep-alive connection pool of this size
+MAX_CONCURRENT_DOWNLOADS = 32
+# Per-CDN-host cap so a single host is never hit by the whole pool
+MAX_DOWNLOADS_PER_HOST = 16
+# All images come from a handful of CDN hosts, so resolve each once per run
+DNS_CACHE_TTL_SECONDS = 600
+# Progress is reported this many times per run at most, not once per image
+PROGRESS_UPDATES = 50
+# Response bodies are written to disk in chunks of this size instead of buffered whole
+DOWNLOAD_CHUNK_SIZE = 1 << 16
+
+def create_download_session():
+    """Create an HTTP session whose pooled connections are reused across downloads"""
+    connector = aiohttp.TCPConnector(
+        limit=MAX_CONCURRENT_DOWNLOADS,
+        limit_per_host=MAX_DOWNLOADS_PER_HOST,
+        keepalive_timeout=30,
+        ttl_dns_cache=DNS_CACHE_TTL_SECONDS
+    )
+    return aiohttp.ClientSession(connector=connector)
+
+async def download_image(session, semaphore, img_url, output_path):
+    """Download image from URL to specified path (errors propagate to the caller)"""
+    async with semaphore:
+        async with session.get(img_url) as response:
+            response.raise_for_status()
+            try:
+                with open(output_path, 'wb') as output_file:
+                    async for chunk in response.content.iter_chunked(DOWNLOAD_CHUNK_SIZE):
+                        output_file.write(chunk)
+            except BaseException:
+                # Never leave a partial file behind for the skip-if-exists check to trust
+                output_path.unlink(missing_ok=True)
+                raise
+    return output_path
+
+def link_or_copy(source_path, target_path):
+    """Hard-link target_path to an already downloaded file, copying if links are unsupported"""
     try:
-        urllib.request.urlretrieve(img_url, output_path)
-        print(f"Downloaded: {output_path.name}", end="\r")
-    except Exception as e:
-        print(f"Error Downloading {output_path.name}: {e}")
+        if target_path.exists():
+            target_path.unlink()
+        os.link(source_path, target_path)
+    except OSError:
+        shutil.copyfile(source_path, target_path)
+
+async def download_images(downloads, force=False):
+    """
+    Download (image_url, file_path) pairs concurrently over one keep-alive session
+    
+    Args:
+        downloads (list): List of (image_url, Path) tuples
+        force (bool): Re-download images that already exist on disk
+    
+    Returns:
+        tuple: (downloaded file names, failure messages, number of images already on disk)
+    """
+    # Images already on disk from a previous run are kept unless forced
+    already_downloaded = 0
+    if not force:
+        # List each output folder once instead of probing every target path
+        existing = {
+            folder: {entry.name: entry for entry in os.scandir(folder)}
+            for folder in {file_name.parent for _, file_name in downloads}
+            if folder.is_dir()
+        }
+        
+        def is_downloaded(file_name):
+            entry = existing.get(file_name.parent, {}).get(file_name.name)
+            return entry is not None and entry.stat().st_size > 0
+        
+        pending = [(image_url, file_name) for image_url, file_name in downloads
+                   if not is_downloaded(file_name)]
+        already_downloaded = len(downloads) - len(pending)
+        downloads = pending
+    
+    # Fetch each distinct URL once; other pins sharing it get a link to the same file
+    files_by_url = defaultdict(list)
+    for image_url, file_name in downloads:
+        files_by_url[image_url].append(file_name)
+    unique_downloads = [(image_url, file_names[0]) for image_url, file_names in files_by_url.items()]
+    
+    # Group requests by CDN host so each host's keep-alive connections are reused back to back
+    unique_downloads.sort(key=lambda download: urlparse(download[0]).hostname or '')
+    
+    total = len(unique_downloads)
+    progress_step = max(1, total // PROGRESS_UPDATES)
+    completed = 0
+    
+    async def download_with_progress(session, semaphore, image_url, file_name):
+        nonlocal completed
+        try:
+            return await download_image(session, semaphore, image_url, file_name)
+        except (aiohttp.ClientError, asyncio.TimeoutError, OSError) as error:
+            # Expected per-image failures are returned so they don't cancel sibling downloads
+            return error
+        finally:
+            completed += 1
+            if completed % progress_step == 0 or completed == total:
+                print(f"Progress: {completed}/{total} images", end="\r" if completed < total else "\n", flush=True)
+    
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_DOWNLOADS)
+    async with create_download_session() as session:
+        # Anything unexpected propagates out of the group and cancels the remaining downloads
+        async with asyncio.TaskGroup() as task_group:
+            tasks = [
+                task_group.create_task(download_with_progress(session, semaphore, image_url, file_name))
+                for image_url, file_name in unique_downloads
+            ]
+    results = [task.result() for task in tasks]
+    
+    # Collect results so callers can report them in one write
+    downloaded = []
+    failed = []
+    for (image_url, file_name), result in zip(unique_downloads, results):
+        if isinstance(result, BaseException):
+            failed.append(f"Error Downloading {file_name.name}: {result}")
+            continue
+        downloaded.append(file_name.name)
+        for duplicate_file in files_by_url[image_url][1:]:
+            link_or_copy(file_name, duplicate_file)
+            downloaded.append(duplicate_file.name)
+    return downloaded, failed, already_downloaded
+
+def get_export_dir(prompt_name, output_dir=None):
+    """
+    Create (if needed) and return the export folder for a prompt
+    
+    Args:
+        prompt_name (str): Name of the prompt for folder naming
+        output_dir (str): Optional custom output directory (default: exports/)
+    
+    Returns:
+        Path: <output_dir>/<prompt name with spaces and slashes replaced>
+    """
+    safe_prompt = prompt_name.replace(' ', '_').replace('/', '_')
+    export_dir = Path(output_dir or "exports") / safe_prompt
+    export_dir.mkdir(parents=True, exist_ok=True)
+    return export_dir
 
 def export_pins_to_json(pin_data, prompt_name, output_dir=None):
     """
@@ -31,30 +167,33 @@ def export_pins_to_json(pin_data, prompt_name, output_dir=None):
     Returns:
         str: Path to the created JSON file
     """
-    # Create exports directory structure
-    safe_prompt = prompt_name.replace(' ', '_').replace('/', '_')
-    if output_dir:
-        export_dir = Path(output_dir) / safe_prompt
-    else:
-        export_dir = Path("exports") / safe_prompt
+    return write_pins_json(pin_data, get_export_dir(prompt_name, output_dir))
+
+def write_pins_json(pin_data, export_dir):
+    """
+    Write pin data to <export_dir>/<folder name>_metadata.json
     
-    export_dir.mkdir(parents=True, exist_ok=True)
+    Args:
+        pin_data (list): List of pin dictionaries with image_url, pin_url, metadata
+        export_dir (Path): Existing export folder from get_export_dir()
     
-    # Generate JSON file
-    json_file = export_dir / f"{safe_prompt}_metadata.json"
-    with open(json_file, 'w', encoding='utf-8') as f:
-        json.dump(pin_data, f, indent=2, ensure_ascii=False)
+    Returns:
+        str: Path to the created JSON file
+    """
+    json_file = export_dir / f"{export_dir.name}_metadata.json"
+    json_file.write_bytes(orjson.dumps(pin_data, option=orjson.OPT_INDENT_2))
     
     print(f"Exported metadata for {len(pin_data)} pins to: {json_file}")
     return str(json_file)
 
-def download_from_json(json_file_path, output_folder=None):
+async def download_from_json(json_file_path, output_folder=None, force=False):
     """
     Download images from a JSON metadata file containing Pinterest URLs
     
     Args:
         json_file_path (str): Path to the JSON metadata file
         output_folder (str): Optional custom output folder name
+        force (bool): Re-download images that already exist on disk
     """
     json_path = Path(json_file_path)
     
@@ -64,8 +203,7 @@ def download_from_json(json_file_path, output_folder=None):
     
     # Load JSON data
     try:
-        with open(json_path, 'r', encoding='utf-8') as f:
-            pin_data = json.load(f)
+        pin_data = orjson.loads(json_path.read_bytes())
     except Exception as e:
         print(f"Error reading JSON file: {e}")
         return
@@ -85,38 +223,24 @@ def download_from_json(json_file_path, output_folder=None):
     
     print(f"Downloading {len(pin_data)} images to: {output_dir}/")
     
-    # Download images using ThreadPoolExecutor for speed
-    with ThreadPoolExecutor(max_workers=10) as executor:
-        futures = []
-        
-        for index, pin in enumerate(pin_data):
-            try:
-                image_url = pin.get('image_url')
-                if not image_url:
-                    print(f"Skipping pin {index+1}: no image_url found")
-                    continue
-                
-                # Generate filename
-                safe_name = output_dir.name
-                file_name = output_dir / f"{safe_name}_{index+1}.jpg"
-                
-                # Submit download task
-                future = executor.submit(download_image, image_url, file_name)
-                futures.append((future, index+1, file_name.name))
-                
-            except Exception as e:
-                print(f"Error preparing download for pin {index+1}: {e}")
-                continue
-        
-        # Wait for all downloads to complete
-        successful_downloads = 0
-        for future, pin_num, filename in futures:
-            try:
-                future.result()  # Wait for completion
-                print(f"Downloaded: {filename}")
-                successful_downloads += 1
-            except Exception as e:
-                print(f"Failed to download pin {pin_num}: {e}")
+    # Build (url, filename) pairs in one pass; pins without an image_url are skipped
+    safe_name = output_dir.name
+    downloads = [
+        (pin['image_url'], output_dir / f"{safe_name}_{index}.jpg")
+        for index, pin in enumerate(pin_data, 1)
+        if pin.get('image_url')
+    ]
+    skipped = len(pin_data) - len(downloads)
+    if skipped:
+        print(f"Skipping {skipped} pins with no image_url")
+    
+    downloaded, failed, already_downloaded = await download_images(downloads, force=force)
+    if already_downloaded:
+        print(f"Skipped {already_downloaded} images already downloaded (use --force to re-download)")
+    successful_downloads = already_downloaded + len(downloaded)
+    
+    if failed:
+        sys.stdout.write("\n".join(failed) + "\n")
     
     print(f"\nDownload completed! {successful_downloads}/{len(pin_data)} images downloaded to: {output_dir}/")
 
@@ -132,10 +256,15 @@ def main():
         "-o", "--output", 
         help="Custom output folder name (default: derived from JSON filename)"
     )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Re-download images that already exist in the output folder"
+    )
     
     args = parser.parse_args()
     
-    download_from_json(args.json_file, args.output)
+    asyncio.run(download_from_json(args.json_file, args.output, force=args.force))
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
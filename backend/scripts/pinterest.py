@@ -4,14 +4,15 @@ import argparse
 import asyncio
 import sys
 from pathlib import Path
-from dotenv import load_dotenv
+
+try:
+    import uvloop
+except ImportError:
+    # uvloop is optional (not available on Windows); fall back to the default loop
+    uvloop = None
 
 # Add app directory to path for imports
 sys.path.append(str(Path(__file__).parent.parent))
-from app.services.pinterest.warmup import PinterestWarmup
-
-# Load environment variables
-load_dotenv()
 
 def parse_args():
     parser = argparse.ArgumentParser(description="Pinterest Warmup & Scraper")
@@ -27,6 +28,14 @@ def parse_args():
 async def main_async():
     args = parse_args()
     
+    # Heavy imports (Playwright) and .env loading are deferred until after argument
+    # parsing, so --help returns without paying for them
+    from dotenv import load_dotenv
+    from app.services.pinterest.warmup import PinterestWarmup
+    
+    # Load environment variables
+    load_dotenv()
+    
     # Create warmup session with prompt
     warmup = PinterestWarmup(
         prompt=args.prompt,
@@ -84,7 +93,7 @@ async def main_async():
             
             # Download images for testing
             print("\nDownloading images for testing...")
-            download_from_json(json_file)
+            await download_from_json(json_file)
             print("Images downloaded successfully!")
         
     except Exception as e:
@@ -94,6 +103,8 @@ async def main_async():
         await warmup.close()
 
 def main():
+    if uvloop:
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
     asyncio.run(main_async())
 
 if __name__ == "__main__":
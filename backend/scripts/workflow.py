@@ -4,31 +4,45 @@ Main Pinterest Workflow Script
 Runs the complete Pinterest + AI validation workflow + downloads results
 """
 
+import argparse
 import asyncio
-import json
+import io
 import sys
+import threading
+import traceback
 from pathlib import Path
+
+import orjson
 from dotenv import load_dotenv
 from bson import ObjectId
 
-# Add app directory to path for imports
-sys.path.append(str(Path(__file__).parent.parent))
-from app.services.workflow.main import WorkflowOrchestrator
+try:
+    import uvloop
+except ImportError:
+    # uvloop is optional (not available on Windows); fall back to the default loop
+    uvloop = None
+
+# Make the backend package importable when run as a plain script; put it first (once)
+# so `app` resolves on the first path entry instead of after a full sys.path walk
+BACKEND_DIR = str(Path(__file__).resolve().parent.parent)
+if BACKEND_DIR not in sys.path:
+    sys.path.insert(0, BACKEND_DIR)
+from app.services.workflow.main import WorkflowOrchestrator, start_log_listener, stop_log_listener
 from app.database import PromptDB, PinDB
 from app.config import settings
-from download import export_pins_to_json, download_from_json
+from download import get_export_dir, write_pins_json, download_images
 
-load_dotenv()
+# Pinterest credentials are read with os.getenv, so .env is always loaded (exported values win)
+load_dotenv(override=False)
 
-# Configuration
+# Defaults for --prompt and --num-images
 PINTEREST_PROMPT = "harry potter"
 NUM_IMAGES = 20
+# A completed run of the same prompt newer than this is reused instead of scraping again
+PROMPT_CACHE_TTL_SECONDS = 3600
 
-async def run_complete_workflow():
-    """Run the complete Pinterest + AI validation workflow"""
-    
-    print(f"🚀 Running Complete Workflow: '{PINTEREST_PROMPT}'")
-    print("=" * 60)
+async def run_complete_workflow(prompts=(PINTEREST_PROMPT,), num_images: int = NUM_IMAGES, use_cache: bool = True):
+    """Run the complete Pinterest + AI validation workflow for each prompt in turn"""
     
     # Check prerequisites
     if not settings.OPENAI_API_KEY:
@@ -36,126 +50,278 @@ async def run_complete_workflow():
         print("Set OPENAI_API_KEY in .env file")
         return
     
+    prompt_ids = []
+    for prompt_text in prompts:
+        prompt_id = await run_prompt_workflow(prompt_text, num_images=num_images, use_cache=use_cache)
+        if prompt_id:
+            prompt_ids.append(prompt_id)
+    
+    if len(prompts) > 1:
+        print_sweep_summary(prompt_ids)
+
+async def run_prompt_workflow(prompt_text: str, num_images: int = NUM_IMAGES, use_cache: bool = True):
+    """Run the workflow for one prompt; returns its prompt ID (also for partial runs), or None if it failed"""
+    
+    print(f"🚀 Running Complete Workflow: '{prompt_text}'")
+    print("=" * 60)
+    
+    # Export folder is resolved once and shared by the JSON export and image downloads
+    export_dir = get_export_dir(prompt_text)
+    
+    # Warm run: skip the browser and AI phases entirely when this prompt was just processed
+    cached_prompt = use_cache and PromptDB.get_recent_prompt_by_text(prompt_text, max_age_seconds=PROMPT_CACHE_TTL_SECONDS)
+    if cached_prompt:
+        # A smaller earlier run cannot stand in for a request for more pins
+        cached_pin_count = PinDB.count_pins_by_prompt(cached_prompt['_id'])
+        if cached_pin_count < num_images:
+            print(f"♻️  Recent run {cached_prompt['_id']} only has {cached_pin_count}/{num_images} pins, running again")
+            cached_prompt = None
+    if cached_prompt:
+        print(f"♻️  Reusing completed run {cached_prompt['_id']} from {cached_prompt['created_at']}")
+        await download_workflow_results(cached_prompt['_id'], export_dir)
+        print(f"🎉 Complete workflow finished successfully (cached)!")
+        return cached_prompt['_id']
+    
     # Create workflow orchestrator
-    orchestrator = WorkflowOrchestrator(prompt=PINTEREST_PROMPT)
+    orchestrator = WorkflowOrchestrator(prompt=prompt_text)
     print(f"Created workflow orchestrator for prompt: '{orchestrator.prompt}'")
     
-    # Phase 1: Pinterest Workflow
-    print("\n📌 PHASE 1: Pinterest Scraping & Enrichment")
+    # Phase 1 + 2: scraping/enrichment streams each pin straight into AI validation
+    print("\n📌 PHASE 1+2: Pinterest Scraping → AI Validation (streamed, images download in the background)")
     print("-" * 50)
     
-    pinterest_result = await orchestrator.run_pinterest_workflow(
-        num_images=NUM_IMAGES,
-        headless=True
-    )
+    download_tasks = []
     
-    if not pinterest_result['success']:
-        print(f"❌ Pinterest workflow failed: {pinterest_result.get('error', 'Unknown error')}")
-        return
+    def start_background_download(prompt_id):
+        # Image URLs are final once pins are saved, so downloads overlap enrichment and validation
+        scraped_pins = PinDB.get_pins_for_export(prompt_id)
+        download_tasks.append(asyncio.create_task(download_workflow_images(scraped_pins, export_dir)))
     
-    prompt_id = ObjectId(pinterest_result['prompt_id'])
-    pin_count = pinterest_result['pin_count']
+    try:
+        workflow_result = await orchestrator.run_streaming_workflow(
+            num_images=num_images,
+            headless=True,
+            on_pins_saved=start_background_download,
+            use_cache=use_cache
+        )
+    finally:
+        await asyncio.gather(*download_tasks)
     
-    print(f"✅ Pinterest workflow completed!")
-    print(f"   Scraped and enriched: {pin_count} pins")
-    print(f"   Prompt ID: {prompt_id}")
+    if not workflow_result['success']:
+        print(f"❌ Workflow failed: {workflow_result.get('error', 'Unknown error')}")
+        return None
     
-    # Show sample scraped data
-    ready_pins = PinDB.get_pins_by_status(prompt_id, "ready")
-    if ready_pins:
-        sample_pin = ready_pins[0]
-        print(f"\n📋 Sample scraped pin:")
-        print(f"   Title: {sample_pin.get('title', 'No title')}")
-        print(f"   Description: {sample_pin.get('description', 'No description')[:60]}...")
-        print(f"   Status: {sample_pin.get('status', 'unknown')}")
+    prompt_id = ObjectId(workflow_result['prompt_id'])
+    # Pins the validators could not score; the workflow marked such a run as error
+    unevaluated_count = workflow_result.get('unevaluated_count', 0)
     
-    # Phase 2: AI Validation
-    print("\n🤖 PHASE 2: AI Validation")
-    print("-" * 50)
+    # The summary is collected in memory and written to stdout in one go
+    report = io.StringIO()
     
-    ai_result = await orchestrator.run_ai_validation_workflow(prompt_id)
-    
-    if ai_result['success']:
-        print(f"✅ AI validation completed!")
-        print(f"   Evaluated: {ai_result['evaluated_count']} pins")
-        print(f"   Approved: {ai_result['approved_count']} pins (≥0.5 score)")
-        print(f"   Disqualified: {ai_result['disqualified_count']} pins (<0.5 score)")
-        
-        # Show top approved results
-        approved_pins = PinDB.get_pins_by_status(prompt_id, "approved")
-        if approved_pins:
-            print(f"\n🎯 Top approved pins:")
-            approved_sorted = sorted(approved_pins, key=lambda x: x['match_score'], reverse=True)
-            for i, pin in enumerate(approved_sorted[:2], 1):
-                print(f"   {i}. {pin.get('title', 'No title')} (Score: {pin['match_score']:.2f})")
-                print(f"      AI: {pin['ai_explanation'][:70]}...")
+    if unevaluated_count:
+        print(f"⚠️  Pinterest workflow completed, but AI validation is partial: "
+              f"{unevaluated_count} pins were not evaluated", file=report)
     else:
-        print(f"❌ AI validation failed: {ai_result.get('error', 'Unknown error')}")
-        return
+        print(f"✅ Pinterest workflow and AI validation completed!", file=report)
+    print(f"   Scraped and enriched: {workflow_result['pin_count']} pins", file=report)
+    print(f"   Prompt ID: {prompt_id}", file=report)
+    print(f"   Evaluated: {workflow_result['evaluated_count']} pins", file=report)
+    print(f"   Approved: {workflow_result['approved_count']} pins (≥0.5 score)", file=report)
+    print(f"   Disqualified: {workflow_result['disqualified_count']} pins (<0.5 score)", file=report)
+    
+    # Show top approved results (sorted, limited and truncated by MongoDB)
+    top_approved = PinDB.find_display(prompt_id, "approved", limit=2, trunc=70)
+    if top_approved:
+        print(f"\n🎯 Top approved pins:", file=report)
+        for i, pin in enumerate(top_approved, 1):
+            print(f"   {i}. {pin.get('title') or 'No title'} (Score: {pin['match_score']:.2f})", file=report)
+            print(f"      AI: {pin['ai_explanation']}...", file=report)
     
     # Final Results Summary
-    print("\n📊 FINAL RESULTS")
-    print("-" * 50)
+    print("\n📊 FINAL RESULTS", file=report)
+    print("-" * 50, file=report)
     
     # Get final prompt status
-    prompt_doc = PromptDB.get_prompt_by_id(prompt_id)
+    prompt_doc = PromptDB.get_prompt_by_id(prompt_id, projection={"status": 1, "created_at": 1})
     final_status = prompt_doc['status'] if prompt_doc else 'unknown'
     
-    all_pins = PinDB.get_pins_by_prompt(prompt_id)
-    approved_count = len([p for p in all_pins if p.get('status') == 'approved'])
-    disqualified_count = len([p for p in all_pins if p.get('status') == 'disqualified'])
-    ready_count = len([p for p in all_pins if p.get('status') == 'ready'])
+    # The workflow already counted its verdicts, so the pins are not queried again
+    total_pins = workflow_result['pin_count']
+    approved_count = workflow_result['approved_count']
+    disqualified_count = workflow_result['disqualified_count']
     
-    print(f"Prompt Status: {final_status}")
-    print(f"Total Pins: {len(all_pins)}")
-    print(f"  ✅ Approved: {approved_count}")
-    print(f"  ❌ Disqualified: {disqualified_count}")
+    print(f"Prompt Status: {final_status}", file=report)
+    print(f"Total Pins: {total_pins}", file=report)
+    print(f"  ✅ Approved: {approved_count}", file=report)
+    print(f"  ❌ Disqualified: {disqualified_count}", file=report)
+    if unevaluated_count:
+        print(f"  ⏳ Unevaluated: {unevaluated_count}", file=report)
     
-    # Save results
+    # Save results (ObjectId goes through default=str, datetimes are native to orjson)
     results = {
-        'prompt': PINTEREST_PROMPT,
-        'prompt_id': str(prompt_id),
+        'prompt': prompt_text,
+        'prompt_id': prompt_id,
         'final_status': final_status,
-        'total_pins': len(all_pins),
+        'total_pins': total_pins,
         'approved_pins': approved_count,
         'disqualified_pins': disqualified_count,
-        'timestamp': str(prompt_doc['created_at']) if prompt_doc else None
+        'unevaluated_pins': unevaluated_count,
+        'timestamp': prompt_doc['created_at'] if prompt_doc else None
     }
+    results_file = export_dir / "workflow_results.json"
+    results_file.write_bytes(orjson.dumps(results, default=str, option=orjson.OPT_INDENT_2))
+    print(f"Results saved to: {results_file}", file=report)
+    sys.stdout.write(report.getvalue())
     
-    # Phase 3: Download Results
-    print("\n💾 PHASE 3: Download Results")
+    # Phase 3: Export Results (images were downloaded during Phases 1+2)
+    print("\n💾 PHASE 3: Export Results")
     print("-" * 50)
     
-    await download_workflow_results(prompt_id, PINTEREST_PROMPT)
+    export_workflow_results(PinDB.get_pins_for_export(prompt_id), export_dir)
     
-    print(f"🎉 Complete workflow finished successfully!")
+    if unevaluated_count:
+        print(f"⚠️  Workflow finished with partial results: {unevaluated_count} pins left unevaluated")
+    else:
+        print(f"🎉 Complete workflow finished successfully!")
+    return prompt_id
 
-async def download_workflow_results(prompt_id: ObjectId, prompt_text: str):
-    """Download and export workflow results with pin IDs as filenames"""
+def parse_job(line: str, num_images: int, use_cache: bool, jsonl: bool = False):
+    """
+    Turn one stdin line into run_complete_workflow keyword arguments
     
-    # Get all pins from database
-    all_pins = PinDB.get_pins_by_prompt(prompt_id)
-    if not all_pins:
-        print("No pins found to download")
-        return
+    Args:
+        line (str): A prompt, or with jsonl a JSON object such as
+            {"prompt": "...", "num_images": 10, "use_cache": false} ("prompts" takes a list)
+        num_images (int): Pin count used when the job does not set one
+        use_cache (bool): Cache setting used when the job does not set one
+        jsonl (bool): Parse the line as a JSON job instead of a plain prompt
     
-    # Prepare pin data for export with pin IDs as identifiers
-    export_data = []
-    for pin in all_pins:
-        # Handle metadata with datetime serialization
-        metadata = pin.get('metadata', {})
-        if isinstance(metadata, dict):
-            # Convert datetime objects to strings
-            serializable_metadata = {}
-            for key, value in metadata.items():
-                if hasattr(value, 'isoformat'):  # datetime object
-                    serializable_metadata[key] = value.isoformat()
-                else:
-                    serializable_metadata[key] = value
-        else:
-            serializable_metadata = metadata
-        
-        pin_data = {
+    Returns:
+        dict: Keyword arguments for run_complete_workflow, or None if the line is not a valid job
+    """
+    if not jsonl:
+        return {'prompts': [line], 'num_images': num_images, 'use_cache': use_cache}
+    
+    try:
+        # orjson.JSONDecodeError is a ValueError too
+        return validate_job(orjson.loads(line), num_images, use_cache)
+    except ValueError as e:
+        print(f"❌ Skipping invalid job {line!r}: {e}")
+        return None
+
+def positive_int(value) -> int:
+    """
+    Parse a pin count shared by --num-images and JSON jobs
+    
+    Args:
+        value: Command line string or JSON integer
+    
+    Returns:
+        int: The value as an int
+    
+    Raises:
+        ValueError: If the value is not an integer of at least 1
+    """
+    number = int(value)
+    if number < 1:
+        raise ValueError('"num_images" must be a positive integer')
+    return number
+
+def validate_job(job, num_images: int, use_cache: bool) -> dict:
+    """
+    Check a decoded JSON job and fill in defaults
+    
+    Args:
+        job: Decoded JSON value of one stdin line
+        num_images (int): Pin count used when the job does not set one
+        use_cache (bool): Cache setting used when the job does not set one
+    
+    Returns:
+        dict: Keyword arguments for run_complete_workflow
+    
+    Raises:
+        ValueError: If the job is not an object or a field has the wrong type
+    """
+    if not isinstance(job, dict):
+        raise ValueError("a job must be a JSON object")
+    
+    if 'prompts' in job:
+        prompts = job['prompts']
+        if not isinstance(prompts, list) or not prompts:
+            raise ValueError('"prompts" must be a non-empty list of strings')
+    elif 'prompt' in job:
+        prompts = [job['prompt']]
+    else:
+        raise ValueError('a job needs "prompt" or "prompts"')
+    if not all(isinstance(prompt, str) and prompt.strip() for prompt in prompts):
+        raise ValueError("every prompt must be a non-empty string")
+    
+    job_num_images = job.get('num_images', num_images)
+    # bool is a subclass of int, so true/false are rejected explicitly
+    if isinstance(job_num_images, bool) or not isinstance(job_num_images, int):
+        raise ValueError('"num_images" must be a positive integer')
+    job_num_images = positive_int(job_num_images)
+    
+    job_use_cache = job.get('use_cache', use_cache)
+    if not isinstance(job_use_cache, bool):
+        raise ValueError('"use_cache" must be true or false')
+    
+    return {
+        'prompts': [prompt.strip() for prompt in prompts],
+        'num_images': job_num_images,
+        'use_cache': job_use_cache
+    }
+
+async def serve(num_images: int = NUM_IMAGES, use_cache: bool = True, jsonl: bool = False):
+    """Keep one warm process and run the workflow for every job read from stdin (one per line)"""
+    loop = asyncio.get_running_loop()
+    job_queue = asyncio.Queue()
+    
+    def read_jobs():
+        # Blocking stdin reads run on a daemon thread rather than the default executor,
+        # so Ctrl-C exits right away instead of waiting for the next line
+        try:
+            for line in sys.stdin:
+                job = line.strip() and parse_job(line.strip(), num_images, use_cache, jsonl=jsonl)
+                if job:
+                    loop.call_soon_threadsafe(job_queue.put_nowait, job)
+            # EOF ends the worker once queued jobs are done
+            loop.call_soon_threadsafe(job_queue.put_nowait, None)
+        except RuntimeError:
+            # The event loop already closed (interrupted); nothing is left to feed
+            pass
+    
+    threading.Thread(target=read_jobs, name="workflow-stdin", daemon=True).start()
+    print(f"👂 Waiting for {'JSON jobs' if jsonl else 'prompts'} on stdin (one per line, Ctrl-D to stop)")
+    while (job := await job_queue.get()) is not None:
+        # The Mongo client, settings and imports stay warm between jobs
+        try:
+            await run_complete_workflow(**job)
+        except Exception:
+            # One failing job must not take the worker down with it
+            print(f"❌ Job failed, waiting for the next one: {job}")
+            traceback.print_exc()
+
+def print_sweep_summary(prompt_ids: list):
+    """Summarize every prompt of a sweep with one prompts query and one pins query"""
+    prompt_docs = PromptDB.get_prompts_by_ids(prompt_ids, projection={"text": 1, "status": 1})
+    approved_by_prompt = PinDB.get_pins_by_prompts_status(prompt_ids, "approved", projection={"match_score": 1})
+    
+    report = io.StringIO()
+    print("\n📊 SWEEP SUMMARY", file=report)
+    print("-" * 50, file=report)
+    for prompt_id in prompt_ids:
+        prompt_doc = prompt_docs.get(prompt_id, {})
+        approved_pins = approved_by_prompt[prompt_id]
+        best_score = f"{approved_pins[0]['match_score']:.2f}" if approved_pins else "-"
+        print(f"'{prompt_doc.get('text', prompt_id)}': {prompt_doc.get('status', 'unknown')}, "
+              f"{len(approved_pins)} approved (best: {best_score})", file=report)
+    sys.stdout.write(report.getvalue())
+
+def build_export_data(pins: list) -> list:
+    """Convert pin documents into export rows keyed by pin ID (datetimes are left to orjson)"""
+    return [
+        {
             'pin_id': str(pin['_id']),
             'image_url': pin['image_url'],
             'pin_url': pin['pin_url'],
@@ -164,63 +330,105 @@ async def download_workflow_results(prompt_id: ObjectId, prompt_text: str):
             'status': pin.get('status', 'unknown'),
             'match_score': pin.get('match_score'),
             'ai_explanation': pin.get('ai_explanation'),
-            'metadata': serializable_metadata
+            'metadata': pin.get('metadata', {})
         }
-        export_data.append(pin_data)
+        for pin in pins
+    ]
+
+def export_workflow_results(pins: list, export_dir: Path):
+    """Export the given pin documents, including AI verdicts, to JSON"""
+    if not pins:
+        print("No pins found to export")
+        return
     
-    # Export to JSON
+    export_data = build_export_data(pins)
     print(f"Exporting {len(export_data)} pins to JSON...")
-    json_file = export_pins_to_json(export_data, prompt_text)
+    json_file = write_pins_json(export_data, export_dir)
     print(f"✅ JSON exported: {json_file}")
+    print(f"📁 Check {export_dir}/ for results")
+
+async def download_workflow_images(pins: list, export_dir: Path):
+    """Download every given pin image with its pin ID as filename"""
+    if not pins:
+        print("No pins found to download")
+        return
     
-    # Download images with pin IDs as filenames
-    print(f"\nDownloading {len(export_data)} images with pin IDs as filenames...")
-    await download_images_with_pin_ids(export_data, prompt_text)
-    
+    print(f"\nDownloading {len(pins)} images with pin IDs as filenames...")
+    await download_images_with_pin_ids(pins, export_dir)
+
+async def download_workflow_results(prompt_id: ObjectId, export_dir: Path):
+    """Download and export workflow results with pin IDs as filenames"""
+    all_pins = PinDB.get_pins_for_export(prompt_id)
+    export_workflow_results(all_pins, export_dir)
+    await download_workflow_images(all_pins, export_dir)
     print(f"✅ Download phase completed!")
-    print(f"📁 Check exports/{prompt_text.replace(' ', '_')}/ for results")
 
-async def download_images_with_pin_ids(pin_data: list, prompt_text: str):
+async def download_images_with_pin_ids(pins: list, output_dir: Path):
     """Download images using pin IDs as filenames"""
-    import urllib.request
-    from concurrent.futures import ThreadPoolExecutor
+    # Use pin ID as filename; all images share one async keep-alive session
+    downloads = [(pin['image_url'], output_dir / f"{pin['_id']}.jpg") for pin in pins]
+    downloaded, failed, already_downloaded = await download_images(downloads)
+    if already_downloaded:
+        print(f"Skipped {already_downloaded} images already downloaded")
     
-    # Create output directory
-    safe_prompt = prompt_text.replace(' ', '_').replace('/', '_')
-    output_dir = Path("exports") / safe_prompt
-    output_dir.mkdir(parents=True, exist_ok=True)
+    if failed:
+        print("\n".join(failed))
     
-    def download_pin_image(pin):
-        """Download single pin image with pin ID as filename"""
-        try:
-            pin_id = pin['pin_id']
-            image_url = pin['image_url']
-            
-            # Use pin ID as filename
-            filename = f"{pin_id}.jpg"
-            file_path = output_dir / filename
-            
-            urllib.request.urlretrieve(image_url, file_path)
-            return f"Downloaded: {filename}"
-        except Exception as e:
-            return f"Failed to download {pin.get('pin_id', 'unknown')}: {e}"
-    
-    # Download images concurrently
-    with ThreadPoolExecutor(max_workers=10) as executor:
-        futures = [executor.submit(download_pin_image, pin) for pin in pin_data]
-        
-        successful_downloads = 0
-        for future in futures:
-            try:
-                result = future.result()
-                if "Downloaded:" in result:
-                    successful_downloads += 1
-                print(result)
-            except Exception as e:
-                print(f"Download error: {e}")
-    
-    print(f"\n✅ Downloaded {successful_downloads}/{len(pin_data)} images to: {output_dir}/")
+    print(f"\n✅ Downloaded {already_downloaded + len(downloaded)}/{len(pins)} images to: {output_dir}/")
 
-if __name__ == "__main__":
+def main():
+    parser = argparse.ArgumentParser(description="Run the complete Pinterest + AI validation workflow")
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Scrape and re-evaluate every pin instead of reusing recent runs and cached AI verdicts"
+    )
+    parser.add_argument(
+        "--prompt",
+        action="append",
+        dest="prompts",
+        help=f"Prompt to run; repeat to sweep several prompts (default: '{PINTEREST_PROMPT}')"
+    )
+    parser.add_argument(
+        "--num-images",
+        type=positive_int,
+        default=NUM_IMAGES,
+        help=f"Number of pins to scrape per prompt (default: {NUM_IMAGES})"
+    )
+    mode = parser.add_mutually_exclusive_group()
+    mode.add_argument(
+        "--once",
+        action="store_true",
+        help="Run the given prompts once and exit (default)"
+    )
+    mode.add_argument(
+        "--daemon",
+        action="store_true",
+        help="Stay running and process prompts read from stdin, one per line"
+    )
+    mode.add_argument(
+        "--server",
+        action="store_true",
+        help='Stay running and process JSON jobs read from stdin, one per line '
+             '(e.g. {"prompt": "...", "num_images": 10, "use_cache": false})'
+    )
+    args = parser.parse_args()
+    use_cache = not args.no_cache
+    
+    # libuv-backed loop for the scrape, download and OpenAI traffic when available
+    if uvloop:
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    
     # Run the complete Pinterest + AI validation workflow
-    asyncio.run(run_complete_workflow())
+    start_log_listener()
+    try:
+        if args.daemon or args.server:
+            asyncio.run(serve(num_images=args.num_images, use_cache=use_cache, jsonl=args.server))
+        else:
+            prompts = args.prompts or [PINTEREST_PROMPT]
+            asyncio.run(run_complete_workflow(prompts, num_images=args.num_images, use_cache=use_cache))
+    finally:
+        stop_log_listener()
+
+if __name__ == "__main__":
+    main()